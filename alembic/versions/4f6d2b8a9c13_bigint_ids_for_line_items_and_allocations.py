@@ -0,0 +1,40 @@
+"""bigint_ids_for_line_items_and_allocations
+
+Revision ID: 4f6d2b8a9c13
+Revises: e2a8c5f17b64
+Create Date: 2026-02-05 09:48:31.772604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f6d2b8a9c13'
+down_revision: Union[str, None] = 'e2a8c5f17b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('invoice_line_items', 'receipt_allocations')
+
+
+def upgrade() -> None:
+    # Nothing references these ids, so the UUID column is simply replaced;
+    # existing rows are numbered by the identity column as it is added.
+    for table in TABLES:
+        op.drop_constraint(f'{table}_pkey', table, type_='primary')
+        op.drop_column(table, 'id')
+        op.add_column(table, sa.Column('id', sa.BigInteger(), sa.Identity(), nullable=False))
+        op.create_primary_key(f'{table}_pkey', table, ['id'])
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.drop_constraint(f'{table}_pkey', table, type_='primary')
+        op.drop_column(table, 'id')
+        op.add_column(table, sa.Column('id', postgresql.UUID(), server_default=sa.text('gen_random_uuid()'), nullable=False))
+        op.alter_column(table, 'id', server_default=None)
+        op.create_primary_key(f'{table}_pkey', table, ['id'])
@@ -0,0 +1,32 @@
+"""add_composite_query_indexes
+
+Revision ID: 7c3e91a4b2d0
+Revises: d6450bf6e7aa
+Create Date: 2026-01-24 10:05:14.118322
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c3e91a4b2d0'
+down_revision: Union[str, None] = 'd6450bf6e7aa'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_invoices_tenant_status_date', 'invoices', ['tenant_id', 'status', 'invoice_date'], unique=False)
+    op.create_index('ix_receipts_tenant_customer_date', 'receipts', ['tenant_id', 'customer_id', 'receipt_date'], unique=False)
+    op.create_index('ix_sessions_user_active_expires', 'sessions', ['user_id', 'is_active', 'expires_at'], unique=False)
+    op.create_unique_constraint('uq_users_tenant_email', 'users', ['tenant_id', 'email'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_users_tenant_email', 'users', type_='unique')
+    op.drop_index('ix_sessions_user_active_expires', table_name='sessions')
+    op.drop_index('ix_receipts_tenant_customer_date', table_name='receipts')
+    op.drop_index('ix_invoices_tenant_status_date', table_name='invoices')
@@ -0,0 +1,39 @@
+"""monthly_revenue_materialized_view
+
+Revision ID: a3d9e6c41f28
+Revises: 4f6d2b8a9c13
+Create Date: 2026-02-12 11:20:47.305118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3d9e6c41f28'
+down_revision: Union[str, None] = '4f6d2b8a9c13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Paid revenue per tenant per month for the dashboard trend chart;
+    # refreshed nightly by refresh_dashboard_views.py
+    op.execute("""
+        CREATE MATERIALIZED VIEW mv_monthly_revenue AS
+        SELECT tenant_id,
+               date_trunc('month', invoice_date)::date AS month,
+               SUM(total) AS revenue
+        FROM invoices
+        WHERE status = 'Paid'
+        GROUP BY tenant_id, date_trunc('month', invoice_date)::date
+    """)
+    # Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.create_index('ux_mv_monthly_revenue_tenant_month', 'mv_monthly_revenue', ['tenant_id', 'month'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ux_mv_monthly_revenue_tenant_month', table_name='mv_monthly_revenue')
+    op.execute("DROP MATERIALIZED VIEW mv_monthly_revenue")
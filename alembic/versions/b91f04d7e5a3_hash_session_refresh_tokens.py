@@ -0,0 +1,38 @@
+"""hash_session_refresh_tokens
+
+Revision ID: b91f04d7e5a3
+Revises: 7c3e91a4b2d0
+Create Date: 2026-01-26 16:42:08.551730
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b91f04d7e5a3'
+down_revision: Union[str, None] = '7c3e91a4b2d0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('sessions', sa.Column('refresh_token_hash', sa.LargeBinary(length=32), nullable=True))
+    # Existing sessions keep working: hash the stored tokens in place
+    op.execute("UPDATE sessions SET refresh_token_hash = sha256(convert_to(refresh_token, 'UTF8'))")
+    op.alter_column('sessions', 'refresh_token_hash', nullable=False)
+    op.create_index(op.f('ix_sessions_refresh_token_hash'), 'sessions', ['refresh_token_hash'], unique=True)
+    op.drop_index(op.f('ix_sessions_refresh_token'), table_name='sessions')
+    op.drop_column('sessions', 'refresh_token')
+
+
+def downgrade() -> None:
+    # Raw tokens cannot be recovered from their digests; old sessions are revoked
+    op.add_column('sessions', sa.Column('refresh_token', sa.String(length=500), nullable=True))
+    op.execute("UPDATE sessions SET refresh_token = encode(refresh_token_hash, 'hex'), is_active = false")
+    op.alter_column('sessions', 'refresh_token', nullable=False)
+    op.create_index(op.f('ix_sessions_refresh_token'), 'sessions', ['refresh_token'], unique=True)
+    op.drop_index(op.f('ix_sessions_refresh_token_hash'), table_name='sessions')
+    op.drop_column('sessions', 'refresh_token_hash')
@@ -0,0 +1,38 @@
+"""server_side_timestamp_defaults
+
+Revision ID: e2a8c5f17b64
+Revises: b91f04d7e5a3
+Create Date: 2026-02-02 11:20:47.306915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a8c5f17b64'
+down_revision: Union[str, None] = 'b91f04d7e5a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = (
+    'tenants', 'subscriptions', 'users', 'sessions', 'email_verifications',
+    'roles', 'companies', 'client_types', 'account_managers', 'customers',
+    'service_types', 'invoices', 'invoice_line_items', 'receipts',
+    'receipt_allocations', 'credit_notes', 'gst_settings', 'tax_rates',
+    'audit_logs',
+)
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        for column in ('created_at', 'updated_at'):
+            op.alter_column(table, column, server_default=sa.text("timezone('utc', now())"))
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        for column in ('created_at', 'updated_at'):
+            op.alter_column(table, column, server_default=None)
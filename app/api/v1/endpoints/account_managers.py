@@ -1,9 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Body, Query
 from sqlalchemy.orm import Session
 from typing import Optional
-import uuid
 
 from app.core.database import get_db
+from app.utils.ids import uuid7
 from app.core.security import get_current_user
 from app.models.user import User
 from app.models.customer import AccountManager
@@ -41,7 +41,7 @@ def create_account_manager(
         )
     
     manager = AccountManager(
-        id=uuid.uuid4(),
+        id=uuid7(),
         name=request.name,
         email=request.email,
         tenant_id=tenant_id,  # ✅ assign tenant_id
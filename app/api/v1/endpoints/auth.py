@@ -6,16 +6,19 @@ from fastapi import Body
 from datetime import datetime, timedelta
 from app.core.security import get_current_user
 from typing import Any
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Request
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
 from app.core.database import get_db
+from app.core.responses import json_response
+from app.utils.ids import uuid7
 from app.core.security import (
     hash_password,
     verify_password,
     create_access_token,
     create_refresh_token,
+    hash_token,
     verify_token,
 )
 from app.models.user import User, Session as UserSession, EmailVerification
@@ -37,9 +40,39 @@ import uuid
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
 
+# Login/register/refresh responses are built from trusted ORM values, so they
+# are encoded straight to JSON with orjson instead of being validated again
+# against the response model (which stays declared for the OpenAPI docs).
+def _user_payload(user: User) -> dict:
+    return {
+        "id": str(user.id),
+        "email": user.email,
+        "firstName": user.first_name,
+        "lastName": user.last_name,
+        "role": user.role,
+        "roleId": str(user.role_id) if user.role_id else None,
+        "roleName": user.user_role.name if user.user_role else None,
+        "isActive": user.is_active,
+        "emailVerified": user.email_verified,
+    }
+
+
+def _tenant_payload(tenant: Tenant, trial_days_remaining) -> dict:
+    return {
+        "id": str(tenant.id),
+        "name": tenant.name,
+        "slug": tenant.slug,
+        "subscriptionStatus": tenant.subscription_status,
+        "trialStartDate": tenant.trial_start_date.isoformat() if tenant.trial_start_date else None,
+        "trialEndDate": tenant.trial_end_date.isoformat() if tenant.trial_end_date else None,
+        "trialDaysRemaining": trial_days_remaining,
+    }
+
+
 @router.post("/register", response_model=RegisterResponse, status_code=status.HTTP_201_CREATED)
 async def register(
     request: RegisterRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ) -> Any:
     """
@@ -67,7 +100,7 @@ async def register(
     
     try:
         # Create tenant
-        tenant_id = uuid.uuid4()
+        tenant_id = uuid7()
         trial_start = datetime.utcnow()
         trial_end = calculate_trial_end_date(trial_start, days=14)
         
@@ -84,7 +117,7 @@ async def register(
         db.add(tenant)
         
         # Create default roles for the tenant
-        admin_role_id = uuid.uuid4()
+        admin_role_id = uuid7()
         admin_role = Role(
             id=admin_role_id,
             tenant_id=tenant_id,
@@ -97,7 +130,7 @@ async def register(
         db.add(admin_role)
 
         user_role_obj = Role(
-            id=uuid.uuid4(),
+            id=uuid7(),
             tenant_id=tenant_id,
             name="user",
             description="Regular user role with limited access",
@@ -118,7 +151,7 @@ async def register(
             
             if source_role:
                 # Create a copy of this role for the new tenant
-                custom_role_id = uuid.uuid4()
+                custom_role_id = uuid7()
                 custom_role = Role(
                     id=custom_role_id,
                     tenant_id=tenant_id,
@@ -134,7 +167,7 @@ async def register(
                 assigned_role_name = source_role.name
         
         # Create user
-        user_id = uuid.uuid4()
+        user_id = uuid7()
         user = User(
             id=user_id,
             tenant_id=tenant_id,
@@ -151,7 +184,7 @@ async def register(
         
         # Create subscription
         subscription = Subscription(
-            id=uuid.uuid4(),
+            id=uuid7(),
             tenant_id=tenant_id,
             plan_type="trial",
             is_trial=True,
@@ -164,7 +197,7 @@ async def register(
         # Create email verification token
         verification_token = str(uuid.uuid4())
         verification = EmailVerification(
-            id=uuid.uuid4(),
+            id=uuid7(),
             user_id=user_id,
             token=verification_token,
             expires_at=datetime.utcnow() + timedelta(hours=24),
@@ -176,35 +209,21 @@ async def register(
         db.refresh(user)
         db.refresh(tenant)
         
-        # Send verification email
-        await send_verification_email(user.email, verification_token)
+        # Send verification email after the response has gone out;
+        # the SMTP round-trip does not hold up registration
+        background_tasks.add_task(send_verification_email, user.email, verification_token)
         
         # Calculate trial days remaining
         trial_days_remaining = (trial_end - trial_start).days
         
-        return RegisterResponse(
-            user={
-                "id": str(user.id),
-                "email": user.email,
-                "firstName": user.first_name,
-                "lastName": user.last_name,
-                "role": user.role,
-                "roleId": str(user.role_id) if user.role_id else None,
-                "roleName": user.user_role.name if user.user_role else None,
-                "isActive": user.is_active,
-                "emailVerified": user.email_verified,
-            },
-            tenant={
-                "id": str(tenant.id),
-                "name": tenant.name,
-                "slug": tenant.slug,
-                "subscriptionStatus": tenant.subscription_status,
-                "trialStartDate": trial_start.isoformat(),
-                "trialEndDate": trial_end.isoformat(),
-                "trialDaysRemaining": trial_days_remaining,
+        return json_response(
+            status_code=status.HTTP_201_CREATED,
+            content={
+                "user": _user_payload(user),
+                "tenant": _tenant_payload(tenant, trial_days_remaining),
+                "message": "Registration successful. Please check your email to verify your account.",
+                "verificationToken": verification_token,
             },
-            message="Registration successful. Please check your email to verify your account.",
-            verificationToken=verification_token
         )
         
     except IntegrityError as e:
@@ -281,9 +300,9 @@ async def login(
     
     # Create session
     session = UserSession(
-        id=uuid.uuid4(),
+        id=uuid7(),
         user_id=user.id,
-        refresh_token=refresh_token,
+        refresh_token_hash=hash_token(refresh_token),
         access_token=access_token,
         expires_at=datetime.utcnow() + timedelta(days=7),
         ip_address=request.client.host if request.client else None,
@@ -297,33 +316,15 @@ async def login(
     
     db.commit()
     
-    return LoginResponse(
-        user={
-            "id": str(user.id),
-            "email": user.email,
-            "firstName": user.first_name,
-            "lastName": user.last_name,
-            "role": user.role,
-            "roleId": str(user.role_id) if user.role_id else None,
-            "roleName": user.user_role.name if user.user_role else None,
-            "isActive": user.is_active,
-            "emailVerified": user.email_verified,
-        },
-        tenant={
-            "id": str(tenant.id),
-            "name": tenant.name,
-            "slug": tenant.slug,
-            "subscriptionStatus": tenant.subscription_status,
-            "trialStartDate": tenant.trial_start_date.isoformat() if tenant.trial_start_date else None,
-            "trialEndDate": tenant.trial_end_date.isoformat() if tenant.trial_end_date else None,
-            "trialDaysRemaining": trial_days_remaining,
-        },
-        tokens={
+    return json_response({
+        "user": _user_payload(user),
+        "tenant": _tenant_payload(tenant, trial_days_remaining),
+        "tokens": {
             "accessToken": access_token,
             "refreshToken": refresh_token,
             "expiresIn": 1800,
-        }
-    )
+        },
+    })
 
 @router.post("/refresh", response_model=TokenResponse)
 async def refresh_token(
@@ -349,7 +350,7 @@ async def refresh_token(
     
     # Find session
     session = db.query(UserSession).filter(
-        UserSession.refresh_token == request.refreshToken,
+        UserSession.refresh_token_hash == hash_token(request.refreshToken),
         UserSession.is_active == True,
         UserSession.expires_at > datetime.utcnow()
     ).first()
@@ -382,10 +383,10 @@ async def refresh_token(
     session.access_token = access_token
     db.commit()
     
-    return TokenResponse(
-        accessToken=access_token,
-        expiresIn=1800
-    )
+    return json_response({
+        "accessToken": access_token,
+        "expiresIn": 1800,
+    })
 
 
 @router.post("/logout")
@@ -398,7 +399,7 @@ async def logout(
     """
     # Find and revoke session
     session = db.query(UserSession).filter(
-        UserSession.refresh_token == request.refreshToken
+        UserSession.refresh_token_hash == hash_token(request.refreshToken)
     ).first()
     
     if session:
@@ -1,14 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import func, or_
-from uuid import uuid4
 from datetime import datetime
 from typing import Optional
 from app.core.database import get_db
+from app.core.responses import json_response
+from app.utils.ids import uuid7
 from app.core.security import get_current_user
 from app.models.user import User
 from app.models.customer import ClientType, Customer
-from app.schemas.client_type import ClientTypeCreate, ClientTypeUpdate, ClientTypeResponse, ClientTypeListResponse
+from app.schemas.client_type import ClientTypeCreate, ClientTypeResponse, ClientTypeListResponse
 
 router = APIRouter(prefix="/api/v1/client-types", tags=["Client Types"])
 
@@ -70,15 +71,17 @@ def list_client_types(
     
     total_pages = (total + limit - 1) // limit
     
-    return ClientTypeListResponse(
-        data=data,
-        pagination={
-            "total": total,
-            "page": page,
-            "limit": limit,
-            "totalPages": total_pages,
-            "hasMore": page < total_pages
-        }
+    return json_response(
+        ClientTypeListResponse(
+            data=data,
+            pagination={
+                "total": total,
+                "page": page,
+                "limit": limit,
+                "totalPages": total_pages,
+                "hasMore": page < total_pages
+            }
+        )
     )
 
 
@@ -119,7 +122,7 @@ def create_client_type(
         )
     
     # Generate UUID
-    client_type_id = uuid4()
+    client_type_id = uuid7()
     
     # Insert client type
     client_type = ClientType(
@@ -129,9 +132,7 @@ def create_client_type(
         name=payload.name,
         description=payload.description,
         payment_terms=payload.paymentTerms,
-        is_active=payload.isActive if payload.isActive is not None else True,
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow()
+        is_active=payload.isActive if payload.isActive is not None else True
     )
     
     db.add(client_type)
@@ -154,7 +155,7 @@ def create_client_type(
 @router.put("/{id}", response_model=ClientTypeResponse)
 def update_client_type(
     id: str,
-    payload: ClientTypeUpdate,
+    payload: ClientTypeCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
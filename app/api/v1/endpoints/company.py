@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from uuid import uuid4
 from datetime import datetime
 from app.core.database import get_db
+from app.core.responses import json_response
+from app.utils.ids import uuid7
 from app.core.security import get_current_user
 from app.models.user import User
 from app.models.company import Company
@@ -11,6 +12,17 @@ from app.schemas.company import CompanyCreate, CompanyResponse, BankDetails
 router = APIRouter(prefix="/api/v1/company", tags=["Company"])
 
 
+def _bank_details(company: Company) -> dict:
+    """
+    Stored bank_details JSONB in the documented BankDetails shape
+
+    The rest of the response is built from typed columns, but this JSON is
+    free-form, so it is still validated: legacy rows can't leak extra or
+    missing keys past response_model.
+    """
+    return BankDetails.model_validate(company.bank_details).model_dump()
+
+
 @router.get("", response_model=CompanyResponse)
 def get_company_profile(
     db: Session = Depends(get_db),
@@ -27,30 +39,30 @@ def get_company_profile(
             detail="Company profile not found"
         )
     
-    return CompanyResponse(
-        id=str(company.id),
-        companyName=company.name,
-        PAN=company.pan,
-        financialYearFrom=company.financial_year_from.isoformat(),
-        financialYearTo=company.financial_year_to.isoformat(),
-        addressLine1=company.address_line1,
-        addressLine2=company.address_line2,
-        addressLine3=company.address_line3,
-        state=company.state,
-        country=company.country,
-        contactNo1=company.contact_no1,
-        contactNo2=company.contact_no2,
-        contactNo3=company.contact_no3,
-        gstApplicable=company.gst_applicable,
-        gstNumber=company.gst_number,
-        gstStateCode=company.gst_state_code,
-        gstCompoundingCompany=company.gst_compounding_company,
-        groupCompany=company.group_company,
-        groupCode=company.group_code,
-        bankDetails=BankDetails(**company.bank_details),
-        createdAt=company.created_at.isoformat() if company.created_at else None,
-        updatedAt=company.updated_at.isoformat() if company.updated_at else None
-    )
+    return json_response({
+        "id": str(company.id),
+        "companyName": company.name,
+        "PAN": company.pan,
+        "financialYearFrom": company.financial_year_from.isoformat(),
+        "financialYearTo": company.financial_year_to.isoformat(),
+        "addressLine1": company.address_line1,
+        "addressLine2": company.address_line2,
+        "addressLine3": company.address_line3,
+        "state": company.state,
+        "country": company.country,
+        "contactNo1": company.contact_no1,
+        "contactNo2": company.contact_no2,
+        "contactNo3": company.contact_no3,
+        "gstApplicable": company.gst_applicable,
+        "gstNumber": company.gst_number,
+        "gstStateCode": company.gst_state_code,
+        "gstCompoundingCompany": company.gst_compounding_company,
+        "groupCompany": company.group_company,
+        "groupCode": company.group_code,
+        "bankDetails": _bank_details(company),
+        "createdAt": company.created_at.isoformat() if company.created_at else None,
+        "updatedAt": company.updated_at.isoformat() if company.updated_at else None
+    })
 
 
 @router.post("", response_model=CompanyResponse)
@@ -118,7 +130,7 @@ def create_or_update_company(
     else:
         # 7. INSERT new company record
         company = Company(
-            id=uuid4(),
+            id=uuid7(),
             tenant_id=tenant_id,
             name=payload.companyName,
             pan=payload.PAN,
@@ -139,9 +151,7 @@ def create_or_update_company(
             group_company=payload.groupCompany,
             group_code=payload.groupCode,
             bank_details=bank_details_dict,
-            created_by=current_user.id,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+            created_by=current_user.id
         )
         db.add(company)
     
@@ -152,27 +162,27 @@ def create_or_update_company(
     # TODO: Create audit log entry (side effect)
     # TODO: May update tenant settings (side effect)
     
-    return CompanyResponse(
-        id=str(company.id),
-        companyName=company.name,
-        PAN=company.pan,
-        financialYearFrom=company.financial_year_from.isoformat(),
-        financialYearTo=company.financial_year_to.isoformat(),
-        addressLine1=company.address_line1,
-        addressLine2=company.address_line2,
-        addressLine3=company.address_line3,
-        state=company.state,
-        country=company.country,
-        contactNo1=company.contact_no1,
-        contactNo2=company.contact_no2,
-        contactNo3=company.contact_no3,
-        gstApplicable=company.gst_applicable,
-        gstNumber=company.gst_number,
-        gstStateCode=company.gst_state_code,
-        gstCompoundingCompany=company.gst_compounding_company,
-        groupCompany=company.group_company,
-        groupCode=company.group_code,
-        bankDetails=BankDetails(**company.bank_details),
-        createdAt=company.created_at.isoformat() if company.created_at else None,
-        updatedAt=company.updated_at.isoformat() if company.updated_at else None
-    )
\ No newline at end of file
+    return json_response({
+        "id": str(company.id),
+        "companyName": company.name,
+        "PAN": company.pan,
+        "financialYearFrom": company.financial_year_from.isoformat(),
+        "financialYearTo": company.financial_year_to.isoformat(),
+        "addressLine1": company.address_line1,
+        "addressLine2": company.address_line2,
+        "addressLine3": company.address_line3,
+        "state": company.state,
+        "country": company.country,
+        "contactNo1": company.contact_no1,
+        "contactNo2": company.contact_no2,
+        "contactNo3": company.contact_no3,
+        "gstApplicable": company.gst_applicable,
+        "gstNumber": company.gst_number,
+        "gstStateCode": company.gst_state_code,
+        "gstCompoundingCompany": company.gst_compounding_company,
+        "groupCompany": company.group_company,
+        "groupCode": company.group_code,
+        "bankDetails": _bank_details(company),
+        "createdAt": company.created_at.isoformat() if company.created_at else None,
+        "updatedAt": company.updated_at.isoformat() if company.updated_at else None
+    })
\ No newline at end of file
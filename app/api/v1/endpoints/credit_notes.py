@@ -1,13 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import func, or_
-from uuid import uuid4
-from datetime import datetime, date
+from datetime import date
 from typing import Optional
 from decimal import Decimal
 
 
 from app.core.database import get_db
+from app.core.responses import json_response
+from app.utils.ids import uuid7
 from app.core.security import get_current_user
 from app.models.user import User
 from app.models.credit_note import CreditNote
@@ -22,24 +23,32 @@ from app.schemas.credit_note import (
 router = APIRouter(prefix="/api/v1/credit-notes", tags=["Credit Notes"])
 
 
-def build_credit_note_response(credit_note, customer_name, invoice_number=None):
+def build_credit_note_row(credit_note, customer_name, invoice_number=None):
+    """Build credit note response as a plain dict"""
+    return {
+        "id": str(credit_note.id),
+        "creditNoteId": credit_note.credit_note_number,
+        "creditNoteDate": credit_note.credit_note_date.isoformat(),
+        "customerId": str(credit_note.customer_id),
+        "customerName": customer_name,
+        "invoiceId": str(credit_note.invoice_id) if credit_note.invoice_id else None,
+        "invoiceNumber": invoice_number,
+        "reason": credit_note.reason,
+        "amount": float(credit_note.amount),
+        "gstRate": float(credit_note.gst_rate),
+        "gstAmount": float(credit_note.gst_amount),
+        "totalCredit": float(credit_note.total_credit),
+        "status": credit_note.status or "Issued",
+        "notes": credit_note.notes,
+        "createdAt": credit_note.created_at.isoformat() if credit_note.created_at else ""
+    }
+
+
+def build_credit_note_response(credit_note, customer_name, invoice_number=None, status_code=status.HTTP_200_OK):
     """Build credit note response"""
-    return CreditNoteResponse(
-        id=str(credit_note.id),
-        creditNoteId=credit_note.credit_note_number,
-        creditNoteDate=credit_note.credit_note_date.isoformat(),
-        customerId=str(credit_note.customer_id),
-        customerName=customer_name,
-        invoiceId=str(credit_note.invoice_id) if credit_note.invoice_id else None,
-        invoiceNumber=invoice_number,
-        reason=credit_note.reason,
-        amount=float(credit_note.amount),
-        gstRate=float(credit_note.gst_rate),
-        gstAmount=float(credit_note.gst_amount),
-        totalCredit=float(credit_note.total_credit),
-        status=credit_note.status or "Issued",
-        notes=credit_note.notes,
-        createdAt=credit_note.created_at.isoformat() if credit_note.created_at else ""
+    return json_response(
+        build_credit_note_row(credit_note, customer_name, invoice_number),
+        status_code=status_code
     )
 
 
@@ -110,22 +119,22 @@ def list_credit_notes(
     
     # Build response
     data = [
-        build_credit_note_response(cn, customer_name, invoice_number)
+        build_credit_note_row(cn, customer_name, invoice_number)
         for cn, customer_name, invoice_number in results
     ]
     
     total_pages = (total + limit - 1) // limit
     
-    return CreditNoteListResponse(
-        data=data,
-        pagination={
+    return json_response({
+        "data": data,
+        "pagination": {
             "total": total,
             "page": page,
             "limit": limit,
             "totalPages": total_pages,
             "hasMore": page < total_pages
         }
-    )
+    })
 
 
 @router.get("/{id}", response_model=CreditNoteResponse)
@@ -253,7 +262,7 @@ def create_credit_note(
     total_credit = Decimal(str(payload.amount)) + gst_amount
     
     # 8. Insert credit note record
-    credit_note_id = uuid4()
+    credit_note_id = uuid7()
     credit_note = CreditNote(
         id=credit_note_id,
         tenant_id=tenant_id,
@@ -268,9 +277,7 @@ def create_credit_note(
         total_credit=total_credit,
         status="Issued",
         notes=payload.notes,
-        created_by=user_id,
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow()
+        created_by=user_id
     )
     
     db.add(credit_note)
@@ -281,4 +288,6 @@ def create_credit_note(
     db.refresh(credit_note)
     
     # 11. Return created credit note
-    return build_credit_note_response(credit_note, customer.name, invoice_number)
\ No newline at end of file
+    return build_credit_note_response(
+        credit_note, customer.name, invoice_number, status.HTTP_201_CREATED
+    )
\ No newline at end of file
@@ -1,10 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import func, or_
-from uuid import uuid4
 from datetime import datetime
 from typing import Optional
 from app.core.database import get_db
+from app.core.responses import json_response
+from app.utils.ids import uuid7
 from app.core.security import get_current_user
 from app.models.user import User
 from app.models.customer import Customer
@@ -26,31 +27,36 @@ def _is_gst_applicable(company: Optional[Company]) -> bool:
     return True
 
 
-def _to_response(customer: Customer) -> CustomerResponse:
-    """Convert Customer model to response schema"""
-    return CustomerResponse(
-        id=str(customer.id),
-        code=customer.code,
-        name=customer.name,
-        addressLine1=customer.address_line1 or "",
-        addressLine2=customer.address_line2 or "",
-        addressLine3=customer.address_line3 or "",
-        state=customer.state or "",
-        country=customer.country or "",
-        email=customer.email or "",
-        whatsapp=customer.whatsapp or "",
-        phone=customer.phone or "",
-        contactPerson=customer.contact_person or "",
-        customerNote=customer.customer_note or "",
-        gstNumber=customer.gst_number,
-        panNumber=customer.pan_number,
-        gstExempted=customer.gst_exempted,
-        gstExemptionReason=customer.gst_exemption_reason,
-        paymentTerms=customer.payment_terms,
-        isActive=customer.is_active,
-        createdAt=customer.created_at.isoformat() if customer.created_at else "",
-        updatedAt=customer.updated_at.isoformat() if customer.updated_at else ""
-    )
+def _to_row(customer: Customer) -> dict:
+    """Convert Customer model to a plain response dict"""
+    return {
+        "id": str(customer.id),
+        "code": customer.code,
+        "name": customer.name,
+        "addressLine1": customer.address_line1 or "",
+        "addressLine2": customer.address_line2 or "",
+        "addressLine3": customer.address_line3 or "",
+        "state": customer.state or "",
+        "country": customer.country or "",
+        "email": customer.email or "",
+        "whatsapp": customer.whatsapp or "",
+        "phone": customer.phone or "",
+        "contactPerson": customer.contact_person or "",
+        "customerNote": customer.customer_note or "",
+        "gstNumber": customer.gst_number,
+        "panNumber": customer.pan_number,
+        "gstExempted": customer.gst_exempted,
+        "gstExemptionReason": customer.gst_exemption_reason,
+        "paymentTerms": customer.payment_terms,
+        "isActive": customer.is_active,
+        "createdAt": customer.created_at.isoformat() if customer.created_at else "",
+        "updatedAt": customer.updated_at.isoformat() if customer.updated_at else ""
+    }
+
+
+def _to_response(customer: Customer, status_code: int = status.HTTP_200_OK):
+    """Serialize a Customer straight to JSON"""
+    return json_response(_to_row(customer), status_code=status_code)
 
 
 @router.get("", response_model=CustomerListResponse)
@@ -109,23 +115,24 @@ def list_customers(
     # 8. Calculate totalPages
     total_pages = (total + limit - 1) // limit
     
-    # Convert to response
+    # Convert to plain dicts; the list is serialized directly, without
+    # building a pydantic model per row
     data = [
-        _to_response(customer)
+        _to_row(customer)
         for customer in results
     ]
     
     # 9. Return data and pagination metadata
-    return CustomerListResponse(
-        data=data,
-        pagination={
+    return json_response({
+        "data": data,
+        "pagination": {
             "total": total,
             "page": page,
             "limit": limit,
             "totalPages": total_pages,
             "hasMore": page < total_pages
         }
-    )
+    })
 
 
 @router.get("/{id}", response_model=CustomerResponse)
@@ -213,7 +220,7 @@ def create_customer(
     # 7-8. Validate GST and PAN formats (handled by Pydantic validators)
     
     # 9. Generate UUID for customer
-    customer_id = uuid4()
+    customer_id = uuid7()
     
     # 10. Set created_by = current user_id
     # 11. Insert customer record
@@ -239,9 +246,7 @@ def create_customer(
         gst_exemption_reason=gst_exemption_reason,
         payment_terms=payload.paymentTerms,
         is_active=payload.isActive if payload.isActive is not None else True,
-        created_by=current_user.id,
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow()
+        created_by=current_user.id
     )
     
     db.add(customer)
@@ -256,7 +261,7 @@ def create_customer(
     # TODO: Check subscription limits (free tier: max 50 customers)
     
     # 13. Return created customer with joined data
-    return _to_response(customer)
+    return _to_response(customer, status.HTTP_201_CREATED)
 
 @router.put("/{id}", response_model=CustomerResponse)
 def update_customer(
@@ -1,10 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from uuid import uuid4
 from datetime import datetime
 from typing import Optional
 
 from app.core.database import get_db
+from app.utils.ids import uuid7
 from app.core.security import get_current_user
 from app.models.user import User
 from app.models.gst import GSTSetting, TaxRate
@@ -114,7 +114,7 @@ def create_or_update_gst_settings(
         is_new = False
     else:
         # INSERT settings
-        gst_setting_id = uuid4()
+        gst_setting_id = uuid7()
         gst_setting = GSTSetting(
             id=gst_setting_id,
             tenant_id=tenant_id,
@@ -123,9 +123,7 @@ def create_or_update_gst_settings(
             effective_date=payload.effectiveDate,
             default_rate=payload.defaultRate,
             display_format=payload.displayFormat,
-            filing_frequency=payload.filingFrequency,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+            filing_frequency=payload.filingFrequency
         )
         db.add(gst_setting)
         is_new = True
@@ -140,15 +138,13 @@ def create_or_update_gst_settings(
     if payload.taxRates:
         for tr in payload.taxRates:
             tax_rate = TaxRate(
-                id=uuid4(),
+                id=uuid7(),
                 tenant_id=tenant_id,
                 gst_setting_id=gst_setting.id,
                 category=tr.category,
                 rate=tr.rate,
                 effective_from=tr.effectiveFrom,
-                description=tr.description,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
+                description=tr.description
             )
             db.add(tax_rate)
             new_tax_rates.append(tax_rate)
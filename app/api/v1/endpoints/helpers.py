@@ -174,6 +174,7 @@ def get_customer_pending_invoices(
     
     # 5. Return only invoices with outstanding amount > 0
     result = []
+    today = date.today()
     for invoice, paid_amount in invoices:
         paid_amount = float(paid_amount) if paid_amount else 0.0
         outstanding = float(invoice.total) - paid_amount
@@ -182,7 +183,7 @@ def get_customer_pending_invoices(
             # Calculate status
             if invoice.payment_status == 'paid':
                 status_str = 'Paid'
-            elif invoice.due_date < date.today():
+            elif invoice.due_date < today:
                 status_str = 'Overdue'
             else:
                 status_str = 'Pending'
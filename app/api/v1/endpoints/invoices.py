@@ -1,15 +1,19 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from fastapi.responses import StreamingResponse, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import func, or_, and_
-from uuid import uuid4
+from sqlalchemy import func, or_, and_, insert
 from datetime import datetime, date
 from typing import Optional, List
-from decimal import Decimal
+from decimal import Decimal, ROUND_HALF_UP
 import io
+import tempfile
 
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.responses import json_response
+from app.utils.ids import uuid7
 from app.core.security import get_current_user
+from app.core.dependencies import json_body, json_body_openapi
 from app.models.user import User
 from app.models.invoice import Invoice, InvoiceLineItem
 from app.models.customer import Customer
@@ -19,32 +23,77 @@ from app.models.credit_note import CreditNote
 from app.models.company import Company
 from app.schemas.invoice import (
     InvoiceCreate,
-    InvoiceUpdate,
+    parse_invoice_bytes,
     InvoiceResponse,
     InvoiceListResponse,
     InvoiceLineItemResponse,
     EmailInvoiceRequest,
     EmailInvoiceResponse
 )
-from app.services.pdf import generate_invoice_pdf
+from app.services.pdf import (
+    cache_invoice_pdf,
+    generate_invoice_pdf_cached,
+    get_cached_invoice_pdf,
+    invoice_pdf_cache_key,
+    write_invoice_pdf
+)
 from app.services.email import send_invoice_email as send_email
 
 router = APIRouter(prefix="/api/v1/invoices", tags=["Invoices"])
 
 
+_CENTS = Decimal("0.01")
+_PDF_SPOOL_SIZE = 1024 * 1024
+_PDF_CHUNK_SIZE = 64 * 1024
+
+
+def iter_spooled_file(spool):
+    """Yield a spooled file in fixed-size chunks, closing it once drained"""
+    try:
+        spool.seek(0)
+        while chunk := spool.read(_PDF_CHUNK_SIZE):
+            yield chunk
+    finally:
+        spool.close()
+
+
 def calculate_line_item_amounts(line_item_data):
     """Calculate amounts for a line item"""
-    amount = float(line_item_data.quantity) * float(line_item_data.rate)
-    tax_amount = amount * (float(line_item_data.taxRate) / 100)
+    amount = (line_item_data['quantity'] * line_item_data['rate']).quantize(_CENTS, ROUND_HALF_UP)
+    tax_amount = (amount * line_item_data['taxRate'] / 100).quantize(_CENTS, ROUND_HALF_UP)
     total = amount + tax_amount
     
     return {
-        'amount': round(amount, 2),
-        'tax_amount': round(tax_amount, 2),
-        'total': round(total, 2)
+        'amount': amount,
+        'tax_amount': tax_amount,
+        'total': total
     }
 
 
+def insert_line_items(db: Session, tenant_id, invoice_id, line_items_data):
+    """Insert all line items of an invoice in a single executemany INSERT"""
+    if not line_items_data:
+        return
+    db.execute(
+        insert(InvoiceLineItem),
+        [
+            {
+                "tenant_id": tenant_id,
+                "invoice_id": invoice_id,
+                "service_type_id": li_data['data']['serviceType'],
+                "description": li_data['data'].get('description'),
+                "quantity": li_data['data']['quantity'],
+                "rate": li_data['data']['rate'],
+                "amount": li_data['amounts']['amount'],
+                "tax_rate": li_data['data']['taxRate'],
+                "tax_amount": li_data['amounts']['tax_amount'],
+                "total": li_data['amounts']['total'],
+            }
+            for li_data in line_items_data
+        ],
+    )
+
+
 def calculate_invoice_status(invoice, db: Session):
     """Calculate invoice status based on receipts and due date"""
     # Check if invoice is fully paid by checking receipt allocations
@@ -82,11 +131,11 @@ def build_invoice_response(invoice, customer, line_items_with_service, db: Sessi
     return InvoiceResponse(
         id=str(invoice.id),
         invoiceNumber=invoice.invoice_number,
-        invoiceDate=invoice.invoice_date.isoformat(),
+        invoiceDate=invoice.invoice_date,
         customerId=str(invoice.customer_id),
         customerName=customer.name,
         customerGst=customer.gst_number,
-        dueDate=invoice.due_date.isoformat(),
+        dueDate=invoice.due_date,
         referenceNumber=invoice.reference_number,
         lineItems=line_items,
         subtotal=float(invoice.subtotal),
@@ -94,8 +143,8 @@ def build_invoice_response(invoice, customer, line_items_with_service, db: Sessi
         total=float(invoice.total),
         status=calculate_invoice_status(invoice, db),
         notes=invoice.notes,
-        createdAt=invoice.created_at.isoformat() if invoice.created_at else "",
-        updatedAt=invoice.updated_at.isoformat() if invoice.updated_at else ""
+        createdAt=invoice.created_at,
+        updatedAt=invoice.updated_at
     )
 
 
@@ -229,7 +278,7 @@ def list_invoices(
             ServiceType, InvoiceLineItem.service_type_id == ServiceType.id
         ).filter(
             InvoiceLineItem.invoice_id == invoice.id
-        ).order_by(InvoiceLineItem.created_at.asc()).all()
+        ).order_by(InvoiceLineItem.id.asc()).all()
         
         # Build customer object
         customer = type('Customer', (), {
@@ -241,15 +290,17 @@ def list_invoices(
     
     total_pages = (total + limit - 1) // limit
     
-    return InvoiceListResponse(
-        data=data,
-        pagination={
-            "total": total,
-            "page": page,
-            "limit": limit,
-            "totalPages": total_pages,
-            "hasMore": page < total_pages
-        }
+    return json_response(
+        InvoiceListResponse(
+            data=data,
+            pagination={
+                "total": total,
+                "page": page,
+                "limit": limit,
+                "totalPages": total_pages,
+                "hasMore": page < total_pages
+            }
+        )
     )
 
 
@@ -291,15 +342,16 @@ def get_invoice(
         ServiceType, InvoiceLineItem.service_type_id == ServiceType.id
     ).filter(
         InvoiceLineItem.invoice_id == invoice.id
-    ).order_by(InvoiceLineItem.created_at.asc()).all()
+    ).order_by(InvoiceLineItem.id.asc()).all()
     
     # Return complete invoice object
     return build_invoice_response(invoice, customer, line_items_query, db)
 
 
-@router.post("", response_model=InvoiceResponse, status_code=status.HTTP_201_CREATED)
+@router.post("", response_model=InvoiceResponse, status_code=status.HTTP_201_CREATED,
+             openapi_extra=json_body_openapi(InvoiceCreate))
 def create_invoice(
-    payload: InvoiceCreate,
+    payload: InvoiceCreate = Depends(json_body(parse_invoice_bytes)),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -323,7 +375,7 @@ def create_invoice(
         )
     
     # Verify all service types exist and belong to tenant
-    service_type_ids = [li.serviceType for li in payload.lineItems]
+    service_type_ids = [li['serviceType'] for li in payload.lineItems]
     service_types = db.query(ServiceType).filter(
         ServiceType.id.in_(service_type_ids),
         ServiceType.tenant_id == tenant_id
@@ -371,7 +423,7 @@ def create_invoice(
     total = subtotal + tax_total
     
     # Insert invoice record (NO payment_status field)
-    invoice_id = uuid4()
+    invoice_id = uuid7()
     invoice = Invoice(
         id=invoice_id,
         tenant_id=tenant_id,
@@ -384,31 +436,14 @@ def create_invoice(
         tax_total=tax_total,
         total=total,
         notes=payload.notes,
-        created_by=user_id,
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow()
+        created_by=user_id
     )
     
     db.add(invoice)
+    db.flush()  # invoice row must exist before the line item FKs
     
     # Insert line items
-    for li_data in line_items_data:
-        line_item = InvoiceLineItem(
-            id=uuid4(),
-            tenant_id=tenant_id,
-            invoice_id=invoice_id,
-            service_type_id=li_data['data'].serviceType,
-            description=li_data['data'].description,
-            quantity=li_data['data'].quantity,
-            rate=li_data['data'].rate,
-            amount=li_data['amounts']['amount'],
-            tax_rate=li_data['data'].taxRate,
-            tax_amount=li_data['amounts']['tax_amount'],
-            total=li_data['amounts']['total'],
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
-        )
-        db.add(line_item)
+    insert_line_items(db, tenant_id, invoice_id, line_items_data)
     
     db.commit()
     db.refresh(invoice)
@@ -421,7 +456,7 @@ def create_invoice(
         ServiceType, InvoiceLineItem.service_type_id == ServiceType.id
     ).filter(
         InvoiceLineItem.invoice_id == invoice.id
-    ).order_by(InvoiceLineItem.created_at.asc()).all()
+    ).order_by(InvoiceLineItem.id.asc()).all()
     
     return build_invoice_response(invoice, customer, line_items_query, db)
 
@@ -429,7 +464,7 @@ def create_invoice(
 @router.put("/{id}", response_model=InvoiceResponse)
 def update_invoice(
     id: str,
-    payload: InvoiceUpdate,
+    payload: InvoiceCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -485,7 +520,7 @@ def update_invoice(
         )
     
     # Verify service types
-    service_type_ids = [li.serviceType for li in payload.lineItems]
+    service_type_ids = [li['serviceType'] for li in payload.lineItems]
     service_types = db.query(ServiceType).filter(
         ServiceType.id.in_(service_type_ids),
         ServiceType.tenant_id == tenant_id
@@ -531,23 +566,7 @@ def update_invoice(
     total = subtotal + tax_total
     
     # Insert new line items
-    for li_data in line_items_data:
-        line_item = InvoiceLineItem(
-            id=uuid4(),
-            tenant_id=tenant_id,
-            invoice_id=id,
-            service_type_id=li_data['data'].serviceType,
-            description=li_data['data'].description,
-            quantity=li_data['data'].quantity,
-            rate=li_data['data'].rate,
-            amount=li_data['amounts']['amount'],
-            tax_rate=li_data['data'].taxRate,
-            tax_amount=li_data['amounts']['tax_amount'],
-            total=li_data['amounts']['total'],
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
-        )
-        db.add(line_item)
+    insert_line_items(db, tenant_id, id, line_items_data)
     
     # Update invoice record (NO payment_status)
     invoice.invoice_number = payload.invoiceNumber or invoice.invoice_number
@@ -572,7 +591,7 @@ def update_invoice(
         ServiceType, InvoiceLineItem.service_type_id == ServiceType.id
     ).filter(
         InvoiceLineItem.invoice_id == invoice.id
-    ).order_by(InvoiceLineItem.created_at.asc()).all()
+    ).order_by(InvoiceLineItem.id.asc()).all()
     
     return build_invoice_response(invoice, customer, line_items_query, db)
 
@@ -706,16 +725,29 @@ def get_invoice_pdf(
         "taxId": company.tax_id if company else ""
     }
     
-    # Generate PDF
-    pdf_content = generate_invoice_pdf(invoice_data, company_data)
+    headers = {
+        "Content-Disposition": f"attachment; filename=Invoice_{invoice.invoice_number}.pdf"
+    }
+    
+    # Unchanged invoice rendered before: serve the cached bytes
+    cache_key = invoice_pdf_cache_key(invoice_data, company_data)
+    pdf_content = get_cached_invoice_pdf(cache_key)
+    if pdf_content is not None:
+        return Response(content=pdf_content, media_type="application/pdf", headers=headers)
+    
+    # Render into a spool that stays in memory for typical invoices and rolls
+    # over to disk for very long ones, then stream it out in chunks
+    spool = tempfile.SpooledTemporaryFile(max_size=_PDF_SPOOL_SIZE)
+    write_invoice_pdf(invoice_data, company_data, spool)
+    if spool.tell() <= settings.INVOICE_PDF_CACHE_ITEM_MAX_BYTES:
+        spool.seek(0)
+        cache_invoice_pdf(cache_key, spool.read())
     
     # Return PDF as download
-    return Response(
-        content=pdf_content,
+    return StreamingResponse(
+        iter_spooled_file(spool),
         media_type="application/pdf",
-        headers={
-            "Content-Disposition": f"attachment; filename=Invoice_{invoice.invoice_number}.pdf"
-        }
+        headers=headers
     )
 
 
@@ -789,7 +821,7 @@ def send_invoice_email(
     }
     
     # Generate PDF
-    pdf_content = generate_invoice_pdf(invoice_data, company_data)
+    pdf_content = generate_invoice_pdf_cached(invoice_data, company_data)
     
     # Send email with PDF attachment
     success = send_email(
@@ -1,19 +1,22 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func, or_
-from uuid import uuid4
+from sqlalchemy import func, or_, insert
 from datetime import datetime, date
 from typing import Optional
 from decimal import Decimal
 
 from app.core.database import get_db
+from app.core.responses import json_response
+from app.utils.ids import uuid7
 from app.core.security import get_current_user
+from app.core.dependencies import json_body, json_body_openapi
 from app.models.user import User
 from app.models.receipt import Receipt, ReceiptAllocation
 from app.models.invoice import Invoice
 from app.models.customer import Customer
 from app.schemas.receipt import (
     ReceiptCreate,
+    parse_receipt_bytes,
     ReceiptResponse,
     ReceiptCreateResponse,
     ReceiptListResponse,
@@ -40,7 +43,7 @@ def build_receipt_response(receipt, customer_name, allocations_with_invoices, in
     base_data = {
         "id": str(receipt.id),
         "receiptId": receipt.receipt_number,
-        "receiptDate": receipt.receipt_date.isoformat(),
+        "receiptDate": receipt.receipt_date,
         "customerId": str(receipt.customer_id),
         "customerName": customer_name,
         "paymentMethod": receipt.payment_method,
@@ -50,7 +53,7 @@ def build_receipt_response(receipt, customer_name, allocations_with_invoices, in
         "unappliedAmount": round(unapplied_amount, 2),
         "notes": receipt.notes,
         "status": receipt.status or "Completed",
-        "createdAt": receipt.created_at.isoformat() if receipt.created_at else ""
+        "createdAt": receipt.created_at
     }
     
     if include_invoices_updated:
@@ -135,15 +138,17 @@ def list_receipts(
     
     total_pages = (total + limit - 1) // limit
     
-    return ReceiptListResponse(
-        data=data,
-        pagination={
-            "total": total,
-            "page": page,
-            "limit": limit,
-            "totalPages": total_pages,
-            "hasMore": page < total_pages
-        }
+    return json_response(
+        ReceiptListResponse(
+            data=data,
+            pagination={
+                "total": total,
+                "page": page,
+                "limit": limit,
+                "totalPages": total_pages,
+                "hasMore": page < total_pages
+            }
+        )
     )
 
 
@@ -188,9 +193,10 @@ def get_receipt(
     return build_receipt_response(receipt, customer_name, allocations_query)
 
 
-@router.post("", response_model=ReceiptCreateResponse, status_code=status.HTTP_201_CREATED)
+@router.post("", response_model=ReceiptCreateResponse, status_code=status.HTTP_201_CREATED,
+             openapi_extra=json_body_openapi(ReceiptCreate))
 def create_receipt(
-    payload: ReceiptCreate,
+    payload: ReceiptCreate = Depends(json_body(parse_receipt_bytes)),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -212,7 +218,7 @@ def create_receipt(
         )
     
     # Verify all invoices
-    invoice_ids = [alloc.invoiceId for alloc in payload.allocations]
+    invoice_ids = [alloc['invoiceId'] for alloc in payload.allocations]
     invoices = db.query(Invoice).filter(
         Invoice.id.in_(invoice_ids),
         Invoice.customer_id == payload.customerId,
@@ -237,14 +243,14 @@ def create_receipt(
         ReceiptAllocation.invoice_id.in_(invoice_ids)
     ).group_by(ReceiptAllocation.invoice_id).all()
     
-    existing_alloc_map = {str(inv_id): float(total) for inv_id, total in existing_allocations}
+    existing_alloc_map = {str(inv_id): total for inv_id, total in existing_allocations}
     
     # Validate allocations
     total_allocated = 0
     for alloc in payload.allocations:
-        invoice = invoice_map[alloc.invoiceId]
-        existing_paid = existing_alloc_map.get(alloc.invoiceId, 0)
-        outstanding = float(invoice.total) - existing_paid
+        invoice = invoice_map[alloc['invoiceId']]
+        existing_paid = existing_alloc_map.get(alloc['invoiceId'], 0)
+        outstanding = invoice.total - existing_paid
         
         # Check if invoice is already fully paid
         if outstanding <= 0:
@@ -254,13 +260,13 @@ def create_receipt(
             )
         
         # Check allocation doesn't exceed outstanding
-        if alloc.amountAllocated > outstanding:
+        if alloc['amountAllocated'] > outstanding:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Allocation amount {alloc.amountAllocated} exceeds outstanding amount {outstanding} for invoice {invoice.invoice_number}"
+                detail=f"Allocation amount {alloc['amountAllocated']} exceeds outstanding amount {outstanding} for invoice {invoice.invoice_number}"
             )
         
-        total_allocated += alloc.amountAllocated
+        total_allocated += alloc['amountAllocated']
     
     # Check total allocations don't exceed amount received
     if total_allocated > payload.amountReceived:
@@ -294,7 +300,7 @@ def create_receipt(
     unapplied_amount = payload.amountReceived - total_allocated
     
     # Insert receipt record
-    receipt_id = uuid4()
+    receipt_id = uuid7()
     receipt = Receipt(
         id=receipt_id,
         tenant_id=tenant_id,
@@ -305,31 +311,32 @@ def create_receipt(
         amount=payload.amountReceived,
         status="Completed",
         notes=payload.notes,
-        created_by=user_id,
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow()
+        created_by=user_id
     )
     
     db.add(receipt)
+    db.flush()  # receipt row must exist before the allocation FKs
+    
+    # Insert allocation records for each invoice in one executemany INSERT
+    db.execute(
+        insert(ReceiptAllocation),
+        [
+            {
+                "tenant_id": tenant_id,
+                "receipt_id": receipt_id,
+                "invoice_id": alloc['invoiceId'],
+                "allocated_amount": alloc['amountAllocated'],
+            }
+            for alloc in payload.allocations
+        ],
+    )
     
-    # Insert allocation records for each invoice
     invoices_updated = []
     for alloc in payload.allocations:
-        allocation = ReceiptAllocation(
-            id=uuid4(),
-            tenant_id=tenant_id,
-            receipt_id=receipt_id,
-            invoice_id=alloc.invoiceId,
-            allocated_amount=alloc.amountAllocated,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
-        )
-        db.add(allocation)
-        
         # Update invoice updated_at timestamp
         # Note: Invoice status is now calculated dynamically based on receipt allocations
         # So we don't need to update payment_status field anymore
-        invoice = invoice_map[alloc.invoiceId]
+        invoice = invoice_map[alloc['invoiceId']]
         invoice.updated_at = datetime.utcnow()
         invoices_updated.append(invoice.invoice_number)
     
@@ -5,6 +5,8 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from app.core.database import get_db
+from app.core.responses import json_response
+from app.utils.ids import uuid7
 from app.core.security import get_current_admin
 from app.models.role import Role
 from app.models.user import User
@@ -54,7 +56,7 @@ def create_role(
         )
 
     role = Role(
-        id=uuid.uuid4(),
+        id=uuid7(),
         tenant_id=tenant_id,
         name=payload.name,
         description=payload.description,
@@ -82,7 +84,7 @@ def list_roles(
         query = query.filter(Role.is_active == isActive)
         
     roles = query.order_by(Role.name.asc()).all()
-    return RoleListResponse(data=[_to_role_response(role) for role in roles])
+    return json_response(RoleListResponse(data=[_to_role_response(role) for role in roles]))
 
 
 @router.get("/{role_id}", response_model=RoleResponse)
@@ -1,15 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import func, or_
-from uuid import uuid4
 from datetime import datetime
 from typing import Optional
 from app.core.database import get_db
+from app.core.responses import json_response
+from app.utils.ids import uuid7
 from app.core.security import get_current_user
 from app.models.user import User
 from app.models.service import ServiceType
 from app.models.invoice import InvoiceLineItem
-from app.schemas.service_type import ServiceTypeCreate, ServiceTypeUpdate, ServiceTypeResponse, ServiceTypeListResponse
+from app.schemas.service_type import ServiceTypeCreate, ServiceTypeResponse, ServiceTypeListResponse
 
 router = APIRouter(prefix="/api/v1/service-types", tags=["Service Types"])
 
@@ -72,15 +73,17 @@ def list_service_types(
     total_pages = (total + limit - 1) // limit
     
     # 6. Return results
-    return ServiceTypeListResponse(
-        data=data,
-        pagination={
-            "total": total,
-            "page": page,
-            "limit": limit,
-            "totalPages": total_pages,
-            "hasMore": page < total_pages
-        }
+    return json_response(
+        ServiceTypeListResponse(
+            data=data,
+            pagination={
+                "total": total,
+                "page": page,
+                "limit": limit,
+                "totalPages": total_pages,
+                "hasMore": page < total_pages
+            }
+        )
     )
 
 
@@ -123,7 +126,7 @@ def create_service_type(
     # 5. Validate tax rate is between 0 and 100 (handled by Pydantic validator)
     
     # 6. Generate UUID
-    service_type_id = uuid4()
+    service_type_id = uuid7()
     
     # 7. Insert service type
     service_type = ServiceType(
@@ -133,9 +136,7 @@ def create_service_type(
         name=payload.name,
         description=payload.description,
         tax_rate=payload.taxRate,
-        is_active=payload.isActive if payload.isActive is not None else True,
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow()
+        is_active=payload.isActive if payload.isActive is not None else True
     )
     
     db.add(service_type)
@@ -158,7 +159,7 @@ def create_service_type(
 @router.put("/{id}", response_model=ServiceTypeResponse)
 def update_service_type(
     id: str,
-    payload: ServiceTypeUpdate,
+    payload: ServiceTypeCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from datetime import datetime
 
+from app.core.cache import get_tenant_cached
 from app.core.database import get_db
 from app.core.security import get_current_user
 from app.models.user import User
@@ -23,7 +24,7 @@ def get_current_tenant(
     current_user: User = Depends(get_current_user)
 ):
     """Get current tenant details"""
-    tenant = db.query(Tenant).filter(Tenant.id == current_user.tenant_id).first()
+    tenant = get_tenant_cached(db, current_user.tenant_id)
     
     if not tenant:
         raise HTTPException(
@@ -124,7 +125,7 @@ def get_subscription_status(
     current_user: User = Depends(get_current_user)
 ):
     """Get subscription status and limits"""
-    tenant = db.query(Tenant).filter(Tenant.id == current_user.tenant_id).first()
+    tenant = get_tenant_cached(db, current_user.tenant_id)
     
     if not tenant:
         raise HTTPException(
@@ -1,10 +1,12 @@
-from uuid import UUID, uuid4
+from uuid import UUID
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.responses import json_response
+from app.utils.ids import uuid7
 from app.core.security import get_current_user, get_current_admin
 from app.models.user import User
 from app.schemas.user import (
@@ -70,7 +72,7 @@ async def list_users(
 
     users = query.order_by(User.created_at.asc()).all()
 
-    return UserListResponse(data=[_to_user_response(u) for u in users])
+    return json_response(UserListResponse(data=[_to_user_response(u) for u in users]))
 
 
 @router.get("/{id}", response_model=UserResponse)
@@ -125,7 +127,7 @@ async def create_user(
     from app.core.security import hash_password  # top-level import in real code
 
     user = User(
-        id=uuid4(),
+        id=uuid7(),
         tenant_id=tenant_id,
         email=payload.email,
         password_hash=hash_password(payload.password),
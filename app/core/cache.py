@@ -0,0 +1,223 @@
+"""
+Redis-backed cache for read-mostly rows
+Tenant rows are read on most requests and change rarely, so a short-lived
+snapshot saves the database round-trip. Dashboard aggregates are cached the
+same way, per tenant. Caching is disabled when REDIS_URL is not set, and any
+Redis failure falls back to the database.
+"""
+import json
+import logging
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Callable, Optional
+from uuid import UUID
+
+from sqlalchemy import DateTime, event, inspect
+from sqlalchemy.orm import Session, object_session
+
+from app.core.config import settings
+from app.models.company import Company
+from app.models.credit_note import CreditNote
+from app.models.invoice import Invoice
+from app.models.receipt import Receipt
+from app.models.tenant import Tenant
+
+logger = logging.getLogger(__name__)
+
+_redis_client = None
+
+# session.info key: tenant ids whose cache entries are dropped once the session commits
+_PENDING_TENANTS = "cache_invalidate_tenants"
+_PENDING_DASHBOARDS = "cache_invalidate_dashboards"
+
+# Column keys of Tenant, and the subset that must be parsed back to datetime
+_TENANT_COLUMNS = tuple(attr.key for attr in inspect(Tenant).column_attrs)
+_TENANT_DATETIME_COLUMNS = frozenset(
+    attr.key
+    for attr in inspect(Tenant).column_attrs
+    if isinstance(attr.columns[0].type, DateTime)
+)
+
+
+def get_redis():
+    """Return the shared Redis client, or None when caching is disabled"""
+    global _redis_client
+    if _redis_client is None and settings.REDIS_URL:
+        import redis
+
+        _redis_client = redis.Redis.from_url(
+            settings.REDIS_URL, socket_timeout=0.5, socket_connect_timeout=0.5
+        )
+    return _redis_client
+
+
+def _tenant_key(tenant_id) -> str:
+    return f"tenant:{tenant_id}"
+
+
+def _dump_tenant(tenant: Tenant) -> str:
+    data = {}
+    for key in _TENANT_COLUMNS:
+        value = getattr(tenant, key)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif isinstance(value, UUID):
+            value = str(value)
+        data[key] = value
+    return json.dumps(data)
+
+
+def _load_tenant(raw) -> SimpleNamespace:
+    data = json.loads(raw)
+    for key in _TENANT_DATETIME_COLUMNS:
+        if data.get(key):
+            data[key] = datetime.fromisoformat(data[key])
+    data["id"] = UUID(data["id"])
+    return SimpleNamespace(**data)
+
+
+def get_tenant_cached(db: Session, tenant_id) -> Optional[SimpleNamespace]:
+    """
+    Read-only snapshot of a tenant's columns, served from Redis when possible
+
+    Returns None if the tenant does not exist. The snapshot is detached from
+    the session: use db.query(Tenant) when the row needs to be modified.
+    """
+    client = get_redis()
+    key = _tenant_key(tenant_id)
+
+    if client is not None:
+        try:
+            raw = client.get(key)
+            if raw is not None:
+                return _load_tenant(raw)
+        except Exception as e:
+            logger.warning("Tenant cache read failed: %s", e)
+
+    tenant = db.query(Tenant).filter(Tenant.id == tenant_id).first()
+    if not tenant:
+        return None
+
+    raw = _dump_tenant(tenant)
+    if client is not None:
+        try:
+            client.setex(key, settings.TENANT_CACHE_TTL, raw)
+        except Exception as e:
+            logger.warning("Tenant cache write failed: %s", e)
+    return _load_tenant(raw)
+
+
+def invalidate_tenant(tenant_id) -> None:
+    """Drop the cached snapshot for a tenant"""
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        client.delete(_tenant_key(tenant_id))
+    except Exception as e:
+        logger.warning("Tenant cache invalidation failed: %s", e)
+
+
+def _defer_invalidation(target, info_key: str, tenant_id) -> None:
+    """
+    Queue a tenant id for invalidation at commit
+
+    Mapper events fire during flush, before the write is visible to other
+    connections; invalidating there lets a concurrent read re-cache the old
+    row. The id is parked on the session and handled in after_commit.
+    """
+    session = object_session(target)
+    if session is None:
+        return
+    session.info.setdefault(info_key, set()).add(tenant_id)
+
+
+@event.listens_for(Tenant, "after_update")
+@event.listens_for(Tenant, "after_delete")
+def _invalidate_tenant_on_change(mapper, connection, target):
+    """Subscription/status changes must not be served stale"""
+    _defer_invalidation(target, _PENDING_TENANTS, target.id)
+
+
+def _dashboard_generation_key(tenant_id) -> str:
+    return f"dash:{tenant_id}:gen"
+
+
+def _dashboard_key(tenant_id, generation, name: str, *args) -> str:
+    return ":".join(["dash", str(tenant_id), str(generation), name, *map(str, args)])
+
+
+def get_dashboard_cached(tenant_id, name: str, args: tuple, load: Callable[[], Any]) -> Any:
+    """
+    Raw dashboard CRUD output, served from Redis when possible
+
+    load() runs the CRUD query on a miss. Cached Decimals come back as
+    strings; the service layer quantizes money values either way.
+    """
+    client = get_redis()
+    key = None
+
+    if client is not None:
+        try:
+            generation = int(client.get(_dashboard_generation_key(tenant_id)) or 0)
+            key = _dashboard_key(tenant_id, generation, name, *args)
+            raw = client.get(key)
+            if raw is not None:
+                return json.loads(raw)
+        except Exception as e:
+            logger.warning("Dashboard cache read failed: %s", e)
+
+    data = load()
+    if key is not None:
+        try:
+            client.setex(key, settings.DASHBOARD_CACHE_TTL, json.dumps(data, default=str))
+        except Exception as e:
+            logger.warning("Dashboard cache write failed: %s", e)
+    return data
+
+
+def invalidate_dashboard(tenant_id) -> None:
+    """
+    Retire every cached dashboard aggregate of a tenant
+
+    Bumping the generation moves readers to fresh keys in one INCR; the
+    old entries are never read again and age out with DASHBOARD_CACHE_TTL.
+    """
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        client.incr(_dashboard_generation_key(tenant_id))
+    except Exception as e:
+        logger.warning("Dashboard cache invalidation failed: %s", e)
+
+
+@event.listens_for(Invoice, "after_insert")
+@event.listens_for(Invoice, "after_update")
+@event.listens_for(Invoice, "after_delete")
+@event.listens_for(Receipt, "after_insert")
+@event.listens_for(Receipt, "after_update")
+@event.listens_for(Receipt, "after_delete")
+@event.listens_for(CreditNote, "after_insert")
+@event.listens_for(CreditNote, "after_update")
+@event.listens_for(CreditNote, "after_delete")
+@event.listens_for(Company, "after_update")
+def _invalidate_dashboard_on_change(mapper, connection, target):
+    """Billing writes must show up on the next dashboard load"""
+    _defer_invalidation(target, _PENDING_DASHBOARDS, target.tenant_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session):
+    """Drop cache entries for everything the committed transaction touched"""
+    for tenant_id in session.info.pop(_PENDING_TENANTS, ()):
+        invalidate_tenant(tenant_id)
+    for tenant_id in session.info.pop(_PENDING_DASHBOARDS, ()):
+        invalidate_dashboard(tenant_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_invalidations(session):
+    """Rolled-back writes never became visible, so nothing to invalidate"""
+    session.info.pop(_PENDING_TENANTS, None)
+    session.info.pop(_PENDING_DASHBOARDS, None)
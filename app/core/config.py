@@ -30,8 +30,19 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
-    DATABASE_POOL_SIZE: int = 5
-    DATABASE_MAX_OVERFLOW: int = 0
+    DATABASE_POOL_SIZE: int = 25
+    DATABASE_MAX_OVERFLOW: int = 25
+    DATABASE_POOL_RECYCLE: int = 1800
+    HEALTH_CHECK_TTL: int = 5  # seconds a /health DB probe result is reused
+
+    # Cache (Redis); caching is disabled when REDIS_URL is not set
+    REDIS_URL: Optional[str] = None
+    TENANT_CACHE_TTL: int = 60
+    DASHBOARD_CACHE_TTL: int = 120
+    # Per-process cache of rendered invoice PDFs, bounded by total bytes;
+    # larger PDFs are never cached and always streamed
+    INVOICE_PDF_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    INVOICE_PDF_CACHE_ITEM_MAX_BYTES: int = 1024 * 1024
 
     # Email (SMTP)
     MAIL_USERNAME: Optional[str] = None
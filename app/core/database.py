@@ -3,8 +3,7 @@ Database configuration with Render PostgreSQL SSL support
 Place this in: app/core/database.py
 """
 from sqlalchemy import create_engine, event, text
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import declarative_base, sessionmaker
 from sqlalchemy.pool import NullPool
 import os
 import logging
@@ -46,9 +45,9 @@ connect_args = {
 engine_config = {
     "connect_args": connect_args,
     "pool_pre_ping": True,  # Verify connections before use
-    "pool_size": int(os.getenv("DATABASE_POOL_SIZE", 5)),
-    "max_overflow": int(os.getenv("DATABASE_MAX_OVERFLOW", 0)),
-    "pool_recycle": 300,  # Recycle connections every 5 minutes
+    "pool_size": int(os.getenv("DATABASE_POOL_SIZE", 25)),
+    "max_overflow": int(os.getenv("DATABASE_MAX_OVERFLOW", 25)),
+    "pool_recycle": int(os.getenv("DATABASE_POOL_RECYCLE", 1800)),  # Recycle connections every 30 minutes
     "echo": os.getenv("DEBUG", "False").lower() == "true",
 }
 
@@ -1,6 +1,8 @@
 from datetime import date
-from typing import Optional
-from fastapi import Depends, HTTPException, status
+from typing import Any, Callable, Dict, Optional, Type, TypeVar
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
@@ -151,4 +153,54 @@ def get_optional_user(
     try:
         return get_current_user(credentials, db)
     except HTTPException:
-        return None
\ No newline at end of file
+        return None
+
+
+# -------------------------
+# RAW JSON BODY
+# -------------------------
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def json_body(parse: Callable[[bytes], ModelT]) -> Callable[..., Any]:
+    """
+    Dependency that validates the raw request body with `parse`
+    (a TypeAdapter.validate_json wrapper), skipping FastAPI's json.loads +
+    dict validation pass. Errors are reported like a normal body param.
+    """
+    async def dependency(request: Request) -> ModelT:
+        body = await request.body()
+        try:
+            return parse(body)
+        except ValidationError as exc:
+            raise RequestValidationError(
+                [{**err, "loc": ("body", *err["loc"])} for err in exc.errors(include_url=False)],
+                body=body
+            )
+    return dependency
+
+
+def json_body_openapi(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    openapi_extra documenting `model` as the JSON request body of a route
+    that reads it through json_body()
+    """
+    schema = model.model_json_schema()
+    defs = schema.pop("$defs", {})
+
+    def inline(node: Any) -> Any:
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if ref and ref.startswith("#/$defs/"):
+                return inline(defs[ref[len("#/$defs/"):]])
+            return {key: inline(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [inline(value) for value in node]
+        return node
+
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": inline(schema)}}
+        }
+    }
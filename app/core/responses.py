@@ -0,0 +1,27 @@
+"""
+Pre-serialized JSON responses
+
+Endpoints return these directly, so FastAPI skips response_model validation
+and serialization; the route's response_model still documents the schema.
+"""
+from typing import Any
+
+from fastapi import status
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel
+
+
+def json_response(content: Any, status_code: int = status.HTTP_200_OK) -> Response:
+    """
+    Serialize a response body straight to JSON bytes
+
+    Pydantic models go through their own compiled serializer; dicts of
+    already-normalised values go through orjson.
+    """
+    if isinstance(content, BaseModel):
+        return Response(
+            content.model_dump_json(),
+            status_code=status_code,
+            media_type="application/json"
+        )
+    return ORJSONResponse(content, status_code=status_code)
@@ -0,0 +1,23 @@
+"""
+Database engine for the standalone admin/check scripts
+Shares the app's URL normalisation (postgres://, sslmode) and connect args,
+but holds at most one connection since scripts run a handful of statements
+"""
+from functools import lru_cache
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+
+from app.core.database import DATABASE_URL, connect_args
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """Return the process-wide script engine, creating it on first use"""
+    return create_engine(
+        DATABASE_URL,
+        connect_args=connect_args,
+        pool_pre_ping=True,
+        pool_size=1,
+        max_overflow=0,
+    )
@@ -1,3 +1,4 @@
+import hashlib
 from datetime import datetime, timedelta
 from typing import Optional, Union
 from uuid import UUID
@@ -76,6 +77,11 @@ def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None)
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 
+def hash_token(token: str) -> bytes:
+    """SHA-256 digest of a token, used to store and look up sessions"""
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
 # -------------------------
 # TOKEN VERIFICATION
 # -------------------------
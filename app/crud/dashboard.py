@@ -4,15 +4,64 @@ Database-il ninnu dashboard data fetch cheyyunna functions
 """
 from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import func, case, and_, extract
+from sqlalchemy import func, case, and_, extract, text, table, column, literal, Date, Numeric
 from datetime import datetime, date
 from decimal import Decimal
+from functools import lru_cache
 import calendar
 
 from app.models.invoice import Invoice
 from app.models.credit_note import CreditNote
 from app.models.customer import Customer, ClientType
 from app.models.company import Company
+from app.models.receipt import Receipt, ReceiptAllocation
+
+# Zero-fill value for months/buckets with no rows; aggregates stay Decimal
+_ZERO = Decimal("0")
+
+# Aging buckets in display order
+_AGING_RANGES = ('0-30', '31-60', '61-90', '90+')
+
+# Paid revenue per tenant per month, precomputed (see the
+# a3d9e6c41f28 migration) and refreshed nightly
+mv_monthly_revenue = table(
+    'mv_monthly_revenue',
+    column('tenant_id'),
+    column('month', Date),
+    column('revenue', Numeric)
+)
+
+
+def _default_financial_year_start() -> date:
+    """Current year April 1 (Indian FY)"""
+    today = datetime.now()
+    
+    # April to March is FY, so if before April, previous year
+    if today.month < 4:
+        return date(today.year - 1, 4, 1)
+    return date(today.year, 4, 1)
+
+
+@lru_cache(maxsize=16)
+def _period_start(period: str, today: date) -> Optional[date]:
+    """
+    Start date of a customer-revenue period; None for 'all'
+    Only depends on (period, today), so it is worked out once a day
+    """
+    if period == 'month':
+        # Current month start
+        return date(today.year, today.month, 1)
+    if period == 'quarter':
+        # Current quarter start
+        quarter = (today.month - 1) // 3
+        return date(today.year, quarter * 3 + 1, 1)
+    if period == 'year':
+        # Financial year start
+        # This should ideally use company FY, simplified here
+        if today.month < 4:
+            return date(today.year - 1, 4, 1)
+        return date(today.year, 4, 1)
+    return None
 
 
 class DashboardCRUD:
@@ -31,17 +80,27 @@ class DashboardCRUD:
             Company.tenant_id == tenant_id
         ).first()
         
-        if company and company.financial_year_start:
-            return company.financial_year_start
+        if company and company.financial_year_from:
+            return company.financial_year_from
         
-        # Default: Current year April 1 (Indian FY)
-        current_year = datetime.now().year
-        current_month = datetime.now().month
-        
-        # April to March is FY, so if before April, previous year
-        if current_month < 4:
-            return date(current_year - 1, 4, 1)
-        return date(current_year, 4, 1)
+        return _default_financial_year_start()
+
+    @staticmethod
+    def _invoice_paid_on(db: Session, tenant_id: int):
+        """
+        Invoice-wise collection date: last receipt allocated to the invoice
+        (invoice_id, paid_on) subquery; invoices have no payment date column
+        """
+        return db.query(
+            ReceiptAllocation.invoice_id.label('invoice_id'),
+            func.max(Receipt.receipt_date).label('paid_on')
+        ).join(
+            Receipt, ReceiptAllocation.receipt_id == Receipt.id
+        ).filter(
+            ReceiptAllocation.tenant_id == tenant_id
+        ).group_by(
+            ReceiptAllocation.invoice_id
+        ).subquery()
 
     @staticmethod
     def get_total_receivables(db: Session, tenant_id: int) -> Decimal:
@@ -82,20 +141,23 @@ class DashboardCRUD:
     def get_average_collection_period(db: Session, tenant_id: int) -> float:
         """
         Average days to collect payment
-        Payment date - Invoice date-nte average
+        Last receipt date - Invoice date-nte average (Postgres date - date = days)
         """
+        paid_on = DashboardCRUD._invoice_paid_on(db, tenant_id)
+        
         result = db.query(
             func.coalesce(
-                func.avg(
-                    func.datediff(Invoice.payment_date, Invoice.invoice_date)
-                ),
+                func.avg(paid_on.c.paid_on - Invoice.invoice_date),
                 0
             )
+        ).select_from(
+            Invoice
+        ).join(
+            paid_on, paid_on.c.invoice_id == Invoice.id
         ).filter(
             and_(
                 Invoice.tenant_id == tenant_id,
-                Invoice.status == 'Paid',
-                Invoice.payment_date.isnot(None)
+                Invoice.status == 'Paid'
             )
         ).scalar()
         
@@ -145,6 +207,75 @@ class DashboardCRUD:
         
         return company.currency if company else "INR"
 
+    @staticmethod
+    def get_all_metrics(db: Session, tenant_id: int) -> Dict[str, Any]:
+        """
+        Dashboard metric cards-inte ella values um oru query-il
+        
+        Same rules as the single-metric functions above (FY start from
+        financial_year_from, receivables, revenue, collection period from
+        the last allocated receipt date, pending count, credit notes,
+        currency), but computed as FILTERed aggregates over the tenant's
+        invoices plus scalar subqueries, so it is one round-trip instead
+        of seven.
+        """
+        company_fy_start = db.query(Company.financial_year_from).filter(
+            Company.tenant_id == tenant_id
+        ).limit(1).scalar_subquery()
+        company_currency = db.query(Company.currency).filter(
+            Company.tenant_id == tenant_id
+        ).limit(1).scalar_subquery()
+        fy_start = func.coalesce(company_fy_start, _default_financial_year_start())
+        unpaid = Invoice.status.in_(['Pending', 'Overdue'])
+        paid = Invoice.status == 'Paid'
+        # At most one row per invoice, so the outer join leaves the other aggregates unchanged
+        paid_on = DashboardCRUD._invoice_paid_on(db, tenant_id)
+        
+        total_credit_notes = db.query(
+            func.sum(CreditNote.total_credit)
+        ).filter(
+            and_(
+                CreditNote.tenant_id == tenant_id,
+                CreditNote.status == 'Issued'
+            )
+        ).scalar_subquery()
+        
+        row = db.query(
+            func.coalesce(
+                func.sum(Invoice.total).filter(unpaid), 0
+            ).label('total_receivables'),
+            func.coalesce(
+                func.sum(Invoice.total).filter(
+                    and_(paid, Invoice.invoice_date >= fy_start)
+                ), 0
+            ).label('total_revenue'),
+            func.coalesce(
+                func.avg(
+                    paid_on.c.paid_on - Invoice.invoice_date
+                ).filter(
+                    and_(paid, paid_on.c.paid_on.isnot(None))
+                ), 0
+            ).label('average_collection_period'),
+            func.count(Invoice.id).filter(unpaid).label('pending_invoices'),
+            func.coalesce(total_credit_notes, 0).label('total_credit_notes'),
+            func.coalesce(company_currency, 'INR').label('currency')
+        ).select_from(
+            Invoice
+        ).outerjoin(
+            paid_on, paid_on.c.invoice_id == Invoice.id
+        ).filter(
+            Invoice.tenant_id == tenant_id
+        ).one()
+        
+        return {
+            'total_receivables': Decimal(str(row.total_receivables)),
+            'total_revenue': Decimal(str(row.total_revenue)),
+            'average_collection_period': float(row.average_collection_period or 0),
+            'pending_invoices': row.pending_invoices or 0,
+            'total_credit_notes': Decimal(str(row.total_credit_notes)),
+            'currency': row.currency
+        }
+
     @staticmethod
     def get_monthly_revenue_trend(
         db: Session,
@@ -163,45 +294,47 @@ class DashboardCRUD:
         month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
                        'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
         
-        # Current year revenue
-        current_revenue = db.query(
-            extract('month', Invoice.invoice_date).label('month_num'),
-            func.coalesce(func.sum(Invoice.total), 0).label('revenue')
-        ).filter(
-            and_(
-                Invoice.tenant_id == tenant_id,
-                Invoice.status == 'Paid',
-                extract('year', Invoice.invoice_date) == current_year
-            )
-        ).group_by('month_num').all()
-        
-        # Previous year revenue
-        previous_revenue = db.query(
-            extract('month', Invoice.invoice_date).label('month_num'),
-            func.coalesce(func.sum(Invoice.total), 0).label('revenue')
+        # Both years from the precomputed monthly totals (at most 24 rows)
+        mv = mv_monthly_revenue.c
+        rows = db.query(
+            extract('year', mv.month).label('year'),
+            extract('month', mv.month).label('month_num'),
+            mv.revenue
         ).filter(
             and_(
-                Invoice.tenant_id == tenant_id,
-                Invoice.status == 'Paid',
-                extract('year', Invoice.invoice_date) == previous_year
+                mv.tenant_id == tenant_id,
+                mv.month >= date(previous_year, 1, 1),
+                mv.month < date(current_year + 1, 1, 1)
             )
-        ).group_by('month_num').all()
+        ).all()
         
         # Convert to dict for easy lookup
-        current_dict = {int(row.month_num): float(row.revenue) for row in current_revenue}
-        previous_dict = {int(row.month_num): float(row.revenue) for row in previous_revenue}
+        current_dict = {}
+        previous_dict = {}
+        for row in rows:
+            target = current_dict if int(row.year) == current_year else previous_dict
+            target[int(row.month_num)] = row.revenue
         
         # Build result array
         result = []
         for month_num in range(1, months + 1):
             result.append({
                 'month': month_names[month_num - 1],
-                'revenue': current_dict.get(month_num, 0.0),
-                'previousYearRevenue': previous_dict.get(month_num, 0.0)
+                'revenue': current_dict.get(month_num, _ZERO),
+                'previousYearRevenue': previous_dict.get(month_num, _ZERO)
             })
         
         return result
 
+    @staticmethod
+    def refresh_monthly_revenue(db: Session) -> None:
+        """
+        mv_monthly_revenue refresh cheyyunnu (nightly job)
+        CONCURRENTLY, so dashboard reads are not blocked meanwhile
+        """
+        db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_monthly_revenue"))
+        db.commit()
+
     @staticmethod
     def get_aging_analysis(db: Session, tenant_id: int) -> List[Dict[str, Any]]:
         """
@@ -210,11 +343,13 @@ class DashboardCRUD:
         """
         today = date.today()
         
-        # SQL CASE statement using SQLAlchemy
+        # SQL CASE statement using SQLAlchemy; the DB returns at most
+        # one row per bucket
+        days_overdue = literal(today, Date) - Invoice.due_date  # Postgres date - date = days
         age_range = case(
-            (func.datediff(today, Invoice.due_date) <= 30, '0-30'),
-            (func.datediff(today, Invoice.due_date).between(31, 60), '31-60'),
-            (func.datediff(today, Invoice.due_date).between(61, 90), '61-90'),
+            (days_overdue <= 30, '0-30'),
+            (days_overdue <= 60, '31-60'),
+            (days_overdue <= 90, '61-90'),
             else_='90+'
         ).label('age_range')
         
@@ -229,36 +364,16 @@ class DashboardCRUD:
             )
         ).group_by(age_range).all()
         
-        # Convert to list of dicts with proper ordering
-        range_order = {'0-30': 1, '31-60': 2, '61-90': 3, '90+': 4}
-        aging_data = [
+        # All 4 buckets in fixed order, zero fill if missing
+        buckets = {row.age_range: row for row in results}
+        return [
             {
-                'range': row.age_range,
-                'amount': float(row.amount),
-                'count': row.count
+                'range': range_name,
+                'amount': buckets[range_name].amount if range_name in buckets else _ZERO,
+                'count': buckets[range_name].count if range_name in buckets else 0
             }
-            for row in results
+            for range_name in _AGING_RANGES
         ]
-        
-        # Sort by range order
-        aging_data.sort(key=lambda x: range_order.get(x['range'], 5))
-        
-        # Ensure all 4 buckets present (zero fill if missing)
-        all_ranges = ['0-30', '31-60', '61-90', '90+']
-        existing_ranges = {item['range'] for item in aging_data}
-        
-        for range_name in all_ranges:
-            if range_name not in existing_ranges:
-                aging_data.append({
-                    'range': range_name,
-                    'amount': 0.0,
-                    'count': 0
-                })
-        
-        # Re-sort after adding missing buckets
-        aging_data.sort(key=lambda x: range_order.get(x['range'], 5))
-        
-        return aging_data
 
     @staticmethod
     def get_customer_revenue_breakdown(
@@ -271,26 +386,8 @@ class DashboardCRUD:
         Enterprise, SMB, Startup, Individual oke
         Period filter: month, quarter, year, all
         """
-        # Determine date filter
-        date_filter = None
-        today = date.today()
-        
-        if period == 'month':
-            # Current month start
-            date_filter = date(today.year, today.month, 1)
-        elif period == 'quarter':
-            # Current quarter start
-            quarter = (today.month - 1) // 3
-            month = quarter * 3 + 1
-            date_filter = date(today.year, month, 1)
-        elif period == 'year':
-            # Financial year start
-            # This should ideally use company FY, simplified here
-            if today.month < 4:
-                date_filter = date(today.year - 1, 4, 1)
-            else:
-                date_filter = date(today.year, 4, 1)
-        # else: period == 'all', no filter
+        # Determine date filter (None for 'all')
+        date_filter = _period_start(period, date.today())
         
         # Query revenue by client type
         query = db.query(
@@ -315,19 +412,11 @@ class DashboardCRUD:
             func.sum(Invoice.total).desc()
         ).all()
         
-        # Calculate total revenue for percentage
-        total_revenue = sum(float(row.revenue) for row in results)
-        
-        # Build response with percentages
-        revenue_data = []
-        for row in results:
-            revenue = float(row.revenue)
-            percentage = (revenue / total_revenue * 100) if total_revenue > 0 else 0.0
-            
-            revenue_data.append({
+        # Percentages are worked out by the service layer
+        return [
+            {
                 'type': row.type,
-                'revenue': revenue,
-                'percentage': round(percentage, 2)
-            })
-        
-        return revenue_data
\ No newline at end of file
+                'revenue': row.revenue
+            }
+            for row in results
+        ]
\ No newline at end of file
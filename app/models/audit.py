@@ -2,13 +2,18 @@
 Audit Log model
 """
 import uuid
-from sqlalchemy import Column, String, Text
+from typing import TYPE_CHECKING, Optional
+from sqlalchemy import String, Text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.utils.ids import uuid7
 from app.models.base import TimestampMixin, TenantMixin
 
+if TYPE_CHECKING:
+    from app.models.tenant import Tenant
+
 
 class AuditLog(Base, TimestampMixin, TenantMixin):
     """
@@ -17,30 +22,30 @@ class AuditLog(Base, TimestampMixin, TenantMixin):
 
     __tablename__ = "audit_logs"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     # User who performed the action
-    user_id = Column(UUID(as_uuid=True), nullable=True, index=True)
+    user_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), nullable=True, index=True)
 
     # Entity information
-    entity_type = Column(
+    entity_type: Mapped[str] = mapped_column(
         String(100), nullable=False, index=True
     )  # 'invoice', 'customer', etc.
-    entity_id = Column(UUID(as_uuid=True), nullable=True, index=True)
+    entity_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), nullable=True, index=True)
 
     # Action performed
-    action = Column(String(50), nullable=False)  # 'create', 'update', 'delete'
+    action: Mapped[str] = mapped_column(String(50), nullable=False)  # 'create', 'update', 'delete'
 
     # Change tracking
-    old_values = Column(JSONB, nullable=True)
-    new_values = Column(JSONB, nullable=True)
+    old_values: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True, deferred=True)
+    new_values: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True, deferred=True)
 
     # Request metadata
-    ip_address = Column(String(45), nullable=True)
-    user_agent = Column(Text, nullable=True)
+    ip_address: Mapped[Optional[str]] = mapped_column(String(45), nullable=True)
+    user_agent: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True)
 
     # Relationships
-    tenant = relationship("Tenant")
+    tenant: Mapped["Tenant"] = relationship("Tenant")
 
     def __repr__(self):
         return f"<AuditLog {self.entity_type} {self.action} by {self.user_id}>"
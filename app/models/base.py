@@ -3,28 +3,39 @@ Base model classes and mixins
 """
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, ForeignKey
+from sqlalchemy import DateTime, ForeignKey, text
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import declared_attr
+from sqlalchemy.orm import Mapped, declared_attr, mapped_column
 
 from app.core.database import Base
 
+# Server-side "now" for naive UTC timestamp columns
+UTC_NOW = text("timezone('utc', now())")
+
 
 class TimestampMixin:
-    """Mixin for created_at and updated_at timestamps"""
+    """Mixin for created_at and updated_at timestamps
+
+    Timestamps are generated by Postgres on insert (UTC, to match the naive
+    UTC values written by the application) and returned with the INSERT.
+    """
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=UTC_NOW, nullable=False
     )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=UTC_NOW, onupdate=datetime.utcnow, nullable=False
+    )
+
+    __mapper_args__ = {"eager_defaults": True}
 
 
 class TenantMixin:
     """Mixin for tenant_id foreign key"""
 
     @declared_attr
-    def tenant_id(cls):
-        return Column(
+    def tenant_id(cls) -> Mapped[uuid.UUID]:
+        return mapped_column(
             UUID(as_uuid=True),
             ForeignKey("tenants.id", ondelete="CASCADE"),
             nullable=False,
@@ -2,13 +2,19 @@
 Company model - tenant's company profile/information
 """
 import uuid
-from sqlalchemy import Column, String, Date, Text, ForeignKey, Boolean, JSON
+from typing import TYPE_CHECKING, Optional
+from datetime import date
+from sqlalchemy import String, Date, Text, ForeignKey, Boolean, JSON
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.utils.ids import uuid7
 from app.models.base import TimestampMixin, TenantMixin
 
+if TYPE_CHECKING:
+    from app.models.tenant import Tenant
+
 
 class Company(Base, TimestampMixin, TenantMixin):
     """
@@ -18,55 +24,55 @@ class Company(Base, TimestampMixin, TenantMixin):
 
     __tablename__ = "companies"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     # Company details
-    name = Column(String(255), nullable=False)
-    pan = Column(String(10), nullable=False)  # Changed from tax_id to pan
-    registration_number = Column(String(100), nullable=True)  # Keeping this for backward compatibility
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    pan: Mapped[str] = mapped_column(String(10), nullable=False)  # Changed from tax_id to pan
+    registration_number: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)  # Keeping this for backward compatibility
     
     # Financial year
-    financial_year_from = Column(Date, nullable=False)  # Changed from financial_year_start
-    financial_year_to = Column(Date, nullable=False)  # New field
+    financial_year_from: Mapped[date] = mapped_column(Date, nullable=False)  # Changed from financial_year_start
+    financial_year_to: Mapped[date] = mapped_column(Date, nullable=False)  # New field
     
     # Address details - expanded to 3 lines
-    address_line1 = Column(String(255), nullable=False)
-    address_line2 = Column(String(255), nullable=True)
-    address_line3 = Column(String(255), nullable=True)
-    state = Column(String(100), nullable=False)
-    country = Column(String(100), nullable=False)
+    address_line1: Mapped[str] = mapped_column(String(255), nullable=False)
+    address_line2: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    address_line3: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    state: Mapped[str] = mapped_column(String(100), nullable=False)
+    country: Mapped[str] = mapped_column(String(100), nullable=False)
 
     # Contact numbers - 3 contact fields
-    contact_no1 = Column(String(20), nullable=False)
-    contact_no2 = Column(String(20), nullable=True)
-    contact_no3 = Column(String(20), nullable=True)
+    contact_no1: Mapped[str] = mapped_column(String(20), nullable=False)
+    contact_no2: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    contact_no3: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
     
     # GST details
-    gst_applicable = Column(Boolean, default=False, nullable=False)
-    gst_number = Column(String(15), nullable=True)
-    gst_state_code = Column(String(2), nullable=True)
-    gst_compounding_company = Column(Boolean, default=False, nullable=False)
+    gst_applicable: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    gst_number: Mapped[Optional[str]] = mapped_column(String(15), nullable=True)
+    gst_state_code: Mapped[Optional[str]] = mapped_column(String(2), nullable=True)
+    gst_compounding_company: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     
     # Group company details
-    group_company = Column(Boolean, default=False, nullable=False)
-    group_code = Column(String(50), nullable=True)
+    group_company: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    group_code: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     
     # Bank details (stored as JSON object)
-    bank_details = Column(JSON, nullable=False)
+    bank_details: Mapped[dict] = mapped_column(JSON, nullable=False)
     
     # Legacy fields - keeping for backward compatibility (can be removed later)
-    contact_name = Column(String(100), nullable=True)
-    contact_email = Column(String(255), nullable=True)
-    contact_phone = Column(String(20), nullable=True)
-    currency = Column(String(3), default="INR", nullable=True)
-    industry = Column(String(100), nullable=True)
-    company_size = Column(String(50), nullable=True)
+    contact_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    contact_email: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    contact_phone: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    currency: Mapped[Optional[str]] = mapped_column(String(3), default="INR", nullable=True)
+    industry: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    company_size: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
 
     # Audit fields
-    created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+    created_by: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
 
     # Relationships
-    tenant = relationship("Tenant", back_populates="companies")
+    tenant: Mapped["Tenant"] = relationship("Tenant", back_populates="companies")
 
     def __repr__(self):
         return f"<Company {self.name}>"
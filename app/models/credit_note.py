@@ -2,13 +2,22 @@
 Credit Note model
 """
 import uuid
-from sqlalchemy import Column, String, Date, DECIMAL, Text, ForeignKey
+from typing import TYPE_CHECKING, Optional
+from datetime import date
+from decimal import Decimal
+from sqlalchemy import String, Date, DECIMAL, Text, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.utils.ids import uuid7
 from app.models.base import TimestampMixin, TenantMixin
 
+if TYPE_CHECKING:
+    from app.models.customer import Customer
+    from app.models.invoice import Invoice
+    from app.models.tenant import Tenant
+
 
 class CreditNote(Base, TimestampMixin, TenantMixin):
     """
@@ -18,12 +27,12 @@ class CreditNote(Base, TimestampMixin, TenantMixin):
     __tablename__ = "credit_notes"
     __table_args__ = {'extend_existing': True}  # ✅ ഇത് add ചെയ്യുക
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    credit_note_number = Column(String(50), nullable=False)
-    credit_note_date = Column(Date, nullable=False)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    credit_note_number: Mapped[str] = mapped_column(String(50), nullable=False)
+    credit_note_date: Mapped[date] = mapped_column(Date, nullable=False)
 
     # Customer reference
-    customer_id = Column(
+    customer_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("customers.id", ondelete="RESTRICT"),
         nullable=False,
@@ -31,30 +40,30 @@ class CreditNote(Base, TimestampMixin, TenantMixin):
     )
 
     # Invoice reference (optional - credit note might not be against a specific invoice)
-    invoice_id = Column(
+    invoice_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True), ForeignKey("invoices.id"), nullable=True, index=True
     )
 
     # Credit note details
-    reason = Column(String(255), nullable=True)
-    amount = Column(DECIMAL(15, 2), default=0, nullable=False)
-    gst_rate = Column(DECIMAL(5, 2), nullable=True)  # ✅ GST rate in percentage (e.g., 18.00)
-    gst_amount = Column(DECIMAL(15, 2), default=0, nullable=False)
-    total_credit = Column(DECIMAL(15, 2), default=0, nullable=False)
+    reason: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    amount: Mapped[Decimal] = mapped_column(DECIMAL(15, 2), default=0, nullable=False)
+    gst_rate: Mapped[Optional[Decimal]] = mapped_column(DECIMAL(5, 2), nullable=True)  # ✅ GST rate in percentage (e.g., 18.00)
+    gst_amount: Mapped[Decimal] = mapped_column(DECIMAL(15, 2), default=0, nullable=False)
+    total_credit: Mapped[Decimal] = mapped_column(DECIMAL(15, 2), default=0, nullable=False)
 
     # Status (draft, issued, applied, cancelled)
-    status = Column(String(50), default="draft", nullable=False)
+    status: Mapped[str] = mapped_column(String(50), default="draft", nullable=False)
 
     # Notes
-    notes = Column(Text, nullable=True)
+    notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Audit fields
-    created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+    created_by: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
 
     # Relationships
-    tenant = relationship("Tenant", back_populates="credit_notes")
-    customer = relationship("Customer", back_populates="credit_notes")
-    invoice = relationship("Invoice", back_populates="credit_notes")
+    tenant: Mapped["Tenant"] = relationship("Tenant", back_populates="credit_notes")
+    customer: Mapped["Customer"] = relationship("Customer", back_populates="credit_notes")
+    invoice: Mapped[Optional["Invoice"]] = relationship("Invoice", back_populates="credit_notes")
 
     def __repr__(self):
         return f"<CreditNote {self.credit_note_number} - {self.total_credit}>"
@@ -2,13 +2,21 @@
 Customer, Client Type, and Account Manager models
 """
 import uuid
-from sqlalchemy import Column, String, Integer, Boolean, Text, ForeignKey
+from typing import TYPE_CHECKING, List, Optional
+from sqlalchemy import String, Integer, Boolean, Text, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.utils.ids import uuid7
 from app.models.base import TimestampMixin, TenantMixin
 
+if TYPE_CHECKING:
+    from app.models.credit_note import CreditNote
+    from app.models.invoice import Invoice
+    from app.models.receipt import Receipt
+    from app.models.tenant import Tenant
+
 
 class ClientType(Base, TimestampMixin, TenantMixin):
     """
@@ -17,16 +25,16 @@ class ClientType(Base, TimestampMixin, TenantMixin):
 
     __tablename__ = "client_types"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    code = Column(String(50), nullable=False)
-    name = Column(String(255), nullable=False)
-    description = Column(Text, nullable=True)
-    payment_terms = Column(Integer, default=30, nullable=False)
-    is_active = Column(Boolean, default=True, nullable=False)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    code: Mapped[str] = mapped_column(String(50), nullable=False)
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    payment_terms: Mapped[int] = mapped_column(Integer, default=30, nullable=False)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     # Relationships
-    tenant = relationship("Tenant")
-    customers = relationship("Customer", back_populates="client_type")
+    tenant: Mapped["Tenant"] = relationship("Tenant")
+    customers: Mapped[List["Customer"]] = relationship("Customer", back_populates="client_type")
 
     def __repr__(self):
         return f"<ClientType {self.code} - {self.name}>"
@@ -39,14 +47,14 @@ class AccountManager(Base, TimestampMixin, TenantMixin):
 
     __tablename__ = "account_managers"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
-    name = Column(String(255), nullable=False)
-    email = Column(String(255), nullable=False)
-    is_active = Column(Boolean, default=True, nullable=False)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    user_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    email: Mapped[str] = mapped_column(String(255), nullable=False)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     # Relationships
-    tenant = relationship("Tenant")
+    tenant: Mapped["Tenant"] = relationship("Tenant")
 
     def __repr__(self):
         return f"<AccountManager {self.name}>"
@@ -59,48 +67,48 @@ class Customer(Base, TimestampMixin, TenantMixin):
 
     __tablename__ = "customers"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    code = Column(String(50), nullable=False)
-    name = Column(String(255), nullable=False)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    code: Mapped[str] = mapped_column(String(50), nullable=False)
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
 
     # Client type reference
-    client_type_id = Column(
+    client_type_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True), ForeignKey("client_types.id"), nullable=True
     )
 
     # Contact information
-    address_line1 = Column(String(255), nullable=True)
-    address_line2 = Column(String(255), nullable=True)
-    address_line3 = Column(String(255), nullable=True)
-    state = Column(String(100), nullable=True)
-    country = Column(String(100), nullable=True)
-    email = Column(String(255), nullable=True)
-    whatsapp = Column(String(20), nullable=True)
-    phone = Column(String(20), nullable=True)
-    contact_person = Column(String(255), nullable=True)
-    customer_note = Column(Text, nullable=True)
+    address_line1: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    address_line2: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    address_line3: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    state: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    country: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    email: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    whatsapp: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    phone: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    contact_person: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    customer_note: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Tax information
-    gst_number = Column(String(15), nullable=True)
-    pan_number = Column(String(10), nullable=True)
-    gst_exempted = Column(Boolean, default=False, nullable=False)
-    gst_exemption_reason = Column(Text, nullable=True)
+    gst_number: Mapped[Optional[str]] = mapped_column(String(15), nullable=True)
+    pan_number: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
+    gst_exempted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    gst_exemption_reason: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Business terms
-    payment_terms = Column(Integer, default=30, nullable=False)
+    payment_terms: Mapped[int] = mapped_column(Integer, default=30, nullable=False)
 
     # Status
-    is_active = Column(Boolean, default=True, nullable=False)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     # Audit fields
-    created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+    created_by: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
 
     # Relationships
-    tenant = relationship("Tenant", back_populates="customers")
-    client_type = relationship("ClientType", back_populates="customers")
-    invoices = relationship("Invoice", back_populates="customer")
-    receipts = relationship("Receipt", back_populates="customer")
-    credit_notes = relationship("CreditNote", back_populates="customer")
+    tenant: Mapped["Tenant"] = relationship("Tenant", back_populates="customers")
+    client_type: Mapped[Optional["ClientType"]] = relationship("ClientType", back_populates="customers")
+    invoices: Mapped[List["Invoice"]] = relationship("Invoice", back_populates="customer")
+    receipts: Mapped[List["Receipt"]] = relationship("Receipt", back_populates="customer")
+    credit_notes: Mapped[List["CreditNote"]] = relationship("CreditNote", back_populates="customer")
 
     def __repr__(self):
         return f"<Customer {self.code} - {self.name}>"
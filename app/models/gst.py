@@ -2,13 +2,20 @@
 GST Settings and Tax Rate models
 """
 import uuid
-from sqlalchemy import Column, String, Boolean, Date, DECIMAL, Text, ForeignKey
+from typing import TYPE_CHECKING, List, Optional
+from datetime import date
+from decimal import Decimal
+from sqlalchemy import String, Boolean, Date, DECIMAL, Text, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.utils.ids import uuid7
 from app.models.base import TimestampMixin, TenantMixin
 
+if TYPE_CHECKING:
+    from app.models.tenant import Tenant
+
 
 class GSTSetting(Base, TimestampMixin, TenantMixin):
     """
@@ -17,23 +24,23 @@ class GSTSetting(Base, TimestampMixin, TenantMixin):
 
     __tablename__ = "gst_settings"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     # GST configuration
-    is_gst_applicable = Column(Boolean, default=False, nullable=False)
-    gst_number = Column(String(15), nullable=True)
-    effective_date = Column(Date, nullable=True)
-    default_rate = Column(DECIMAL(5, 2), default=0, nullable=False)
+    is_gst_applicable: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    gst_number: Mapped[Optional[str]] = mapped_column(String(15), nullable=True)
+    effective_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    default_rate: Mapped[Decimal] = mapped_column(DECIMAL(5, 2), default=0, nullable=False)
 
     # Display and filing
-    display_format = Column(String(50), nullable=True)  # inclusive, exclusive
-    filing_frequency = Column(
+    display_format: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)  # inclusive, exclusive
+    filing_frequency: Mapped[Optional[str]] = mapped_column(
         String(20), nullable=True
     )  # monthly, quarterly, annually
 
     # Relationships
-    tenant = relationship("Tenant")
-    tax_rates = relationship(
+    tenant: Mapped["Tenant"] = relationship("Tenant")
+    tax_rates: Mapped[List["TaxRate"]] = relationship(
         "TaxRate", back_populates="gst_setting", cascade="all, delete-orphan"
     )
 
@@ -48,20 +55,20 @@ class TaxRate(Base, TimestampMixin, TenantMixin):
 
     __tablename__ = "tax_rates"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    gst_setting_id = Column(
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    gst_setting_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True), ForeignKey("gst_settings.id"), nullable=True
     )
 
     # Tax rate details
-    category = Column(String(100), nullable=False)
-    rate = Column(DECIMAL(5, 2), default=0, nullable=False)
-    effective_from = Column(Date, nullable=False)
-    description = Column(Text, nullable=True)
+    category: Mapped[str] = mapped_column(String(100), nullable=False)
+    rate: Mapped[Decimal] = mapped_column(DECIMAL(5, 2), default=0, nullable=False)
+    effective_from: Mapped[date] = mapped_column(Date, nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Relationships
-    tenant = relationship("Tenant")
-    gst_setting = relationship("GSTSetting", back_populates="tax_rates")
+    tenant: Mapped["Tenant"] = relationship("Tenant")
+    gst_setting: Mapped[Optional["GSTSetting"]] = relationship("GSTSetting", back_populates="tax_rates")
 
     def __repr__(self):
         return f"<TaxRate {self.category} - {self.rate}%>"
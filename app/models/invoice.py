@@ -2,13 +2,24 @@
 Invoice and Invoice Line Item models
 """
 import uuid
-from sqlalchemy import Column, String, Date, DECIMAL, Text, ForeignKey
+from typing import TYPE_CHECKING, List, Optional
+from datetime import date
+from decimal import Decimal
+from sqlalchemy import BigInteger, Identity, String, Date, DECIMAL, Text, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.utils.ids import uuid7
 from app.models.base import TimestampMixin, TenantMixin
 
+if TYPE_CHECKING:
+    from app.models.credit_note import CreditNote
+    from app.models.customer import Customer
+    from app.models.receipt import ReceiptAllocation
+    from app.models.service import ServiceType
+    from app.models.tenant import Tenant
+
 
 class Invoice(Base, TimestampMixin, TenantMixin):
     """
@@ -16,47 +27,47 @@ class Invoice(Base, TimestampMixin, TenantMixin):
     """
 
     __tablename__ = "invoices"
+    __table_args__ = (
+        Index("ix_invoices_tenant_status_date", "tenant_id", "status", "invoice_date"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    invoice_number = Column(String(50), nullable=False)
-    invoice_date = Column(Date, nullable=False)
-    due_date = Column(Date, nullable=False)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    invoice_number: Mapped[str] = mapped_column(String(50), nullable=False)
+    invoice_date: Mapped[date] = mapped_column(Date, nullable=False)
+    due_date: Mapped[date] = mapped_column(Date, nullable=False)
 
     # Customer reference
-    customer_id = Column(
+    customer_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("customers.id", ondelete="RESTRICT"),
         nullable=False,
         index=True,
     )
-    customer_gst = Column(String(15), nullable=True)
-    reference_number = Column(String(100), nullable=True)
+    customer_gst: Mapped[Optional[str]] = mapped_column(String(15), nullable=True)
+    reference_number: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
 
     # Amounts
-    subtotal = Column(DECIMAL(15, 2), default=0, nullable=False)
-    tax_total = Column(DECIMAL(15, 2), default=0, nullable=False)
-    total = Column(DECIMAL(15, 2), default=0, nullable=False)
+    subtotal: Mapped[Decimal] = mapped_column(DECIMAL(15, 2), default=0, nullable=False)
+    tax_total: Mapped[Decimal] = mapped_column(DECIMAL(15, 2), default=0, nullable=False)
+    total: Mapped[Decimal] = mapped_column(DECIMAL(15, 2), default=0, nullable=False)
 
     # Status (draft, pending, paid, overdue, cancelled, partially_paid)
-    status = Column(String(50), default="draft", nullable=False)
+    status: Mapped[str] = mapped_column(String(50), default="draft", nullable=False)
 
     # Notes
-    notes = Column(Text, nullable=True)
+    notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Audit fields
-    created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+    created_by: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
 
     # Relationships
-    tenant = relationship("Tenant", back_populates="invoices")
-    customer = relationship("Customer", back_populates="invoices")
-    line_items = relationship(
+    tenant: Mapped["Tenant"] = relationship("Tenant", back_populates="invoices")
+    customer: Mapped["Customer"] = relationship("Customer", back_populates="invoices")
+    line_items: Mapped[List["InvoiceLineItem"]] = relationship(
         "InvoiceLineItem", back_populates="invoice", cascade="all, delete-orphan"
     )
-    receipt_allocations = relationship("ReceiptAllocation", back_populates="invoice")
-    credit_notes = relationship("CreditNote", back_populates="invoice")
-
-    def __repr__(self):
-        return f"<Invoice {self.invoice_number} - {self.total}>"
+    receipt_allocations: Mapped[List["ReceiptAllocation"]] = relationship("ReceiptAllocation", back_populates="invoice")
+    credit_notes: Mapped[List["CreditNote"]] = relationship("CreditNote", back_populates="invoice")
 
 
 class InvoiceLineItem(Base, TimestampMixin, TenantMixin):
@@ -66,8 +77,9 @@ class InvoiceLineItem(Base, TimestampMixin, TenantMixin):
 
     __tablename__ = "invoice_line_items"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    invoice_id = Column(
+    # Internal row id; line items are only ever addressed through their invoice
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    invoice_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("invoices.id", ondelete="CASCADE"),
         nullable=False,
@@ -75,25 +87,21 @@ class InvoiceLineItem(Base, TimestampMixin, TenantMixin):
     )
 
     # Service type reference
-    service_type_id = Column(
+    service_type_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True), ForeignKey("service_types.id"), nullable=True
     )
 
     # Line item details
-    description = Column(Text, nullable=True)
-    quantity = Column(DECIMAL(10, 2), default=1, nullable=False)
-    rate = Column(DECIMAL(15, 2), default=0, nullable=False)
-    amount = Column(DECIMAL(15, 2), default=0, nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    quantity: Mapped[Decimal] = mapped_column(DECIMAL(10, 2), default=1, nullable=False)
+    rate: Mapped[Decimal] = mapped_column(DECIMAL(15, 2), default=0, nullable=False)
+    amount: Mapped[Decimal] = mapped_column(DECIMAL(15, 2), default=0, nullable=False)
 
     # Tax calculation
-    tax_rate = Column(DECIMAL(5, 2), default=0, nullable=False)
-    tax_amount = Column(DECIMAL(15, 2), default=0, nullable=False)
-    total = Column(DECIMAL(15, 2), default=0, nullable=False)
+    tax_rate: Mapped[Decimal] = mapped_column(DECIMAL(5, 2), default=0, nullable=False)
+    tax_amount: Mapped[Decimal] = mapped_column(DECIMAL(15, 2), default=0, nullable=False)
+    total: Mapped[Decimal] = mapped_column(DECIMAL(15, 2), default=0, nullable=False)
 
     # Relationships
-    tenant = relationship("Tenant")
-    invoice = relationship("Invoice", back_populates="line_items")
-    service_type = relationship("ServiceType", back_populates="invoice_line_items")
-
-    def __repr__(self):
-        return f"<InvoiceLineItem {self.invoice_id} - {self.total}>"
+    invoice: Mapped["Invoice"] = relationship("Invoice", back_populates="line_items")
+    service_type: Mapped[Optional["ServiceType"]] = relationship("ServiceType", back_populates="invoice_line_items")
@@ -2,13 +2,22 @@
 Receipt and Receipt Allocation models
 """
 import uuid
-from sqlalchemy import Column, String, Date, DECIMAL, Text, ForeignKey
+from typing import TYPE_CHECKING, List, Optional
+from datetime import date
+from decimal import Decimal
+from sqlalchemy import BigInteger, Identity, String, Date, DECIMAL, Text, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.utils.ids import uuid7
 from app.models.base import TimestampMixin, TenantMixin
 
+if TYPE_CHECKING:
+    from app.models.customer import Customer
+    from app.models.invoice import Invoice
+    from app.models.tenant import Tenant
+
 
 class Receipt(Base, TimestampMixin, TenantMixin):
     """
@@ -16,13 +25,16 @@ class Receipt(Base, TimestampMixin, TenantMixin):
     """
 
     __tablename__ = "receipts"
+    __table_args__ = (
+        Index("ix_receipts_tenant_customer_date", "tenant_id", "customer_id", "receipt_date"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    receipt_number = Column(String(50), nullable=False)
-    receipt_date = Column(Date, nullable=False)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    receipt_number: Mapped[str] = mapped_column(String(50), nullable=False)
+    receipt_date: Mapped[date] = mapped_column(Date, nullable=False)
 
     # Customer reference
-    customer_id = Column(
+    customer_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("customers.id", ondelete="RESTRICT"),
         nullable=False,
@@ -30,30 +42,27 @@ class Receipt(Base, TimestampMixin, TenantMixin):
     )
 
     # Payment details
-    payment_method = Column(
+    payment_method: Mapped[Optional[str]] = mapped_column(
         String(50), nullable=True
     )  # bank_transfer, cheque, cash, upi, card
-    amount = Column(DECIMAL(15, 2), default=0, nullable=False)
+    amount: Mapped[Decimal] = mapped_column(DECIMAL(15, 2), default=0, nullable=False)
 
     # Status (pending, cleared, bounced, cancelled)
-    status = Column(String(50), default="pending", nullable=False)
+    status: Mapped[str] = mapped_column(String(50), default="pending", nullable=False)
 
     # Notes
-    notes = Column(Text, nullable=True)
+    notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Audit fields
-    created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+    created_by: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
 
     # Relationships
-    tenant = relationship("Tenant", back_populates="receipts")
-    customer = relationship("Customer", back_populates="receipts")
-    allocations = relationship(
+    tenant: Mapped["Tenant"] = relationship("Tenant", back_populates="receipts")
+    customer: Mapped["Customer"] = relationship("Customer", back_populates="receipts")
+    allocations: Mapped[List["ReceiptAllocation"]] = relationship(
         "ReceiptAllocation", back_populates="receipt", cascade="all, delete-orphan"
     )
 
-    def __repr__(self):
-        return f"<Receipt {self.receipt_number} - {self.amount}>"
-
 
 class ReceiptAllocation(Base, TimestampMixin, TenantMixin):
     """
@@ -63,14 +72,15 @@ class ReceiptAllocation(Base, TimestampMixin, TenantMixin):
 
     __tablename__ = "receipt_allocations"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    receipt_id = Column(
+    # Internal row id; allocations are only ever addressed through their receipt
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    receipt_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("receipts.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
-    invoice_id = Column(
+    invoice_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("invoices.id", ondelete="CASCADE"),
         nullable=False,
@@ -78,12 +88,8 @@ class ReceiptAllocation(Base, TimestampMixin, TenantMixin):
     )
 
     # Allocation amount
-    allocated_amount = Column(DECIMAL(15, 2), default=0, nullable=False)
+    allocated_amount: Mapped[Decimal] = mapped_column(DECIMAL(15, 2), default=0, nullable=False)
 
     # Relationships
-    tenant = relationship("Tenant")
-    receipt = relationship("Receipt", back_populates="allocations")
-    invoice = relationship("Invoice", back_populates="receipt_allocations")
-
-    def __repr__(self):
-        return f"<ReceiptAllocation {self.receipt_id} -> {self.invoice_id}>"
+    receipt: Mapped["Receipt"] = relationship("Receipt", back_populates="allocations")
+    invoice: Mapped["Invoice"] = relationship("Invoice", back_populates="receipt_allocations")
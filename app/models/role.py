@@ -1,10 +1,12 @@
 """Role model for tenant-specific authorization roles"""
 import uuid
-from sqlalchemy import Column, String, Boolean, Text, UniqueConstraint, ForeignKey
+from typing import Optional
+from sqlalchemy import String, Boolean, Text, UniqueConstraint, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
+from app.utils.ids import uuid7
 from app.models.base import TimestampMixin
 
 
@@ -16,20 +18,15 @@ class Role(Base, TimestampMixin):
         UniqueConstraint("tenant_id", "name", name="uq_roles_tenant_name"),
     )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    tenant_id = Column(
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    tenant_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("tenants.id", ondelete="SET NULL"),
         nullable=True,
         index=True,
     )
-    name = Column(String(100), nullable=False)
-    description = Column(Text, nullable=True)
-    permissions = Column(JSONB, nullable=True)
-    is_system = Column(Boolean, default=False, nullable=False)
-    is_active = Column(Boolean, default=True, nullable=False)
-
-    tenant = relationship("Tenant")
-
-    def __repr__(self) -> str:  # pragma: no cover - repr helper
-        return f"<Role {self.name} (tenant={self.tenant_id})>"
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    permissions: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    is_system: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
@@ -2,13 +2,19 @@
 Service Type model
 """
 import uuid
-from sqlalchemy import Column, String, Boolean, DECIMAL, Text
+from typing import TYPE_CHECKING, List, Optional
+from decimal import Decimal
+from sqlalchemy import String, Boolean, DECIMAL, Text
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.utils.ids import uuid7
 from app.models.base import TimestampMixin, TenantMixin
 
+if TYPE_CHECKING:
+    from app.models.invoice import InvoiceLineItem
+
 
 class ServiceType(Base, TimestampMixin, TenantMixin):
     """
@@ -17,16 +23,12 @@ class ServiceType(Base, TimestampMixin, TenantMixin):
 
     __tablename__ = "service_types"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    code = Column(String(50), nullable=False)
-    name = Column(String(255), nullable=False)
-    description = Column(Text, nullable=True)
-    tax_rate = Column(DECIMAL(5, 2), default=0, nullable=False)
-    is_active = Column(Boolean, default=True, nullable=False)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    code: Mapped[str] = mapped_column(String(50), nullable=False)
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    tax_rate: Mapped[Decimal] = mapped_column(DECIMAL(5, 2), default=0, nullable=False)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     # Relationships
-    tenant = relationship("Tenant")
-    invoice_line_items = relationship("InvoiceLineItem", back_populates="service_type")
-
-    def __repr__(self):
-        return f"<ServiceType {self.code} - {self.name}>"
+    invoice_line_items: Mapped[List["InvoiceLineItem"]] = relationship("InvoiceLineItem", back_populates="service_type")
@@ -2,14 +2,25 @@
 Tenant and Subscription models
 """
 import uuid
+from typing import TYPE_CHECKING, List, Optional
 from datetime import datetime
-from sqlalchemy import Column, String, Boolean, Integer, DateTime, DECIMAL, ForeignKey, Text
+from decimal import Decimal
+from sqlalchemy import String, Boolean, Integer, DateTime, DECIMAL, ForeignKey, Text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.utils.ids import uuid7
 from app.models.base import TimestampMixin
 
+if TYPE_CHECKING:
+    from app.models.company import Company
+    from app.models.credit_note import CreditNote
+    from app.models.customer import Customer
+    from app.models.invoice import Invoice
+    from app.models.receipt import Receipt
+    from app.models.user import User
+
 
 class Tenant(Base, TimestampMixin):
     """
@@ -19,58 +30,57 @@ class Tenant(Base, TimestampMixin):
 
     __tablename__ = "tenants"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    name = Column(String(255), nullable=False)
-    slug = Column(String(100), unique=True, nullable=False, index=True)
-    email = Column(String(255), nullable=False)
-    domain = Column(String(255), nullable=True)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    slug: Mapped[str] = mapped_column(String(100), unique=True, nullable=False, index=True)
+    email: Mapped[str] = mapped_column(String(255), nullable=False)
+    domain: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
 
     # Trial & Subscription Status
-    subscription_status = Column(
+    subscription_status: Mapped[str] = mapped_column(
         String(50), default="trial", nullable=False
     )  # trial, active, expired, cancelled, suspended
-    trial_start_date = Column(DateTime, nullable=True)
-    trial_end_date = Column(DateTime, nullable=True)
-    is_trial_used = Column(Boolean, default=False, nullable=False)
-    converted_to_paid_at = Column(DateTime, nullable=True)
-    subscription_start_date = Column(DateTime, nullable=True)
-    subscription_end_date = Column(DateTime, nullable=True)
+    trial_start_date: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    trial_end_date: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    is_trial_used: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    converted_to_paid_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    subscription_start_date: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    subscription_end_date: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Usage Tracking (for enforcing limits)
-    current_invoice_count = Column(Integer, default=0, nullable=False)
-    current_customer_count = Column(Integer, default=0, nullable=False)
-    current_user_count = Column(Integer, default=0, nullable=False)
+    current_invoice_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    current_customer_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    current_user_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
 
     # Status
-    is_active = Column(Boolean, default=True, nullable=False)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     # Settings (flexible JSON storage)
-    settings = Column(JSONB, nullable=True)
+    settings: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
 
     # Relationships
-    users = relationship("User", back_populates="tenant", cascade="all, delete-orphan")
-    subscriptions = relationship(
-        "Subscription", back_populates="tenant", cascade="all, delete-orphan"
+    # Tenants are not deleted through the ORM; the tenant_id foreign keys use
+    # ON DELETE CASCADE, so the database removes child rows itself.
+    users: Mapped[List["User"]] = relationship("User", back_populates="tenant", passive_deletes=True)
+    subscriptions: Mapped[List["Subscription"]] = relationship(
+        "Subscription", back_populates="tenant", passive_deletes=True
     )
-    companies = relationship(
-        "Company", back_populates="tenant", cascade="all, delete-orphan"
+    companies: Mapped[List["Company"]] = relationship(
+        "Company", back_populates="tenant", passive_deletes=True
     )
-    customers = relationship(
-        "Customer", back_populates="tenant", cascade="all, delete-orphan"
+    customers: Mapped[List["Customer"]] = relationship(
+        "Customer", back_populates="tenant", passive_deletes=True
     )
-    invoices = relationship(
-        "Invoice", back_populates="tenant", cascade="all, delete-orphan"
+    invoices: Mapped[List["Invoice"]] = relationship(
+        "Invoice", back_populates="tenant", passive_deletes=True
     )
-    receipts = relationship(
-        "Receipt", back_populates="tenant", cascade="all, delete-orphan"
+    receipts: Mapped[List["Receipt"]] = relationship(
+        "Receipt", back_populates="tenant", passive_deletes=True
     )
-    credit_notes = relationship(
-        "CreditNote", back_populates="tenant", cascade="all, delete-orphan"
+    credit_notes: Mapped[List["CreditNote"]] = relationship(
+        "CreditNote", back_populates="tenant", passive_deletes=True
     )
 
-    def __repr__(self):
-        return f"<Tenant {self.name} ({self.slug})>"
-
 
 class Subscription(Base, TimestampMixin):
     """
@@ -80,8 +90,8 @@ class Subscription(Base, TimestampMixin):
 
     __tablename__ = "subscriptions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    tenant_id = Column(
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("tenants.id", ondelete="CASCADE"),
         nullable=False,
@@ -89,33 +99,30 @@ class Subscription(Base, TimestampMixin):
     )
 
     # Subscription Details
-    plan_type = Column(String(50), default="trial", nullable=False)  # trial, paid
-    billing_cycle = Column(String(20), nullable=True)  # monthly, yearly
-    amount = Column(DECIMAL(10, 2), default=0, nullable=False)
-    currency = Column(String(3), default="INR", nullable=False)
+    plan_type: Mapped[str] = mapped_column(String(50), default="trial", nullable=False)  # trial, paid
+    billing_cycle: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)  # monthly, yearly
+    amount: Mapped[Decimal] = mapped_column(DECIMAL(10, 2), default=0, nullable=False)
+    currency: Mapped[str] = mapped_column(String(3), default="INR", nullable=False)
 
     # Trial Tracking
-    is_trial = Column(Boolean, default=True, nullable=False)
-    trial_start_date = Column(DateTime, nullable=True)
-    trial_end_date = Column(DateTime, nullable=True)
-    trial_days_remaining = Column(Integer, nullable=True)
+    is_trial: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    trial_start_date: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    trial_end_date: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    trial_days_remaining: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     # Status
-    status = Column(
+    status: Mapped[str] = mapped_column(
         String(50), default="active", nullable=False
     )  # active, expired, cancelled, suspended
 
     # Payment
-    next_billing_date = Column(DateTime, nullable=True)
-    payment_method = Column(String(50), nullable=True)
-    last_payment_date = Column(DateTime, nullable=True)
-    last_payment_amount = Column(DECIMAL(10, 2), nullable=True)
+    next_billing_date: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    payment_method: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    last_payment_date: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    last_payment_amount: Mapped[Optional[Decimal]] = mapped_column(DECIMAL(10, 2), nullable=True)
 
     # Notes
-    notes = Column(Text, nullable=True)
+    notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True)
 
     # Relationships
-    tenant = relationship("Tenant", back_populates="subscriptions")
-
-    def __repr__(self):
-        return f"<Subscription {self.tenant_id} - {self.plan_type} ({self.status})>"
+    tenant: Mapped["Tenant"] = relationship("Tenant", back_populates="subscriptions")
@@ -2,14 +2,21 @@
 User, Session, and Email Verification models
 """
 import uuid
+from functools import cached_property
+from typing import TYPE_CHECKING, List, Optional
 from datetime import datetime
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text
+from sqlalchemy import event, String, Boolean, DateTime, ForeignKey, Text, Index, UniqueConstraint, LargeBinary
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.utils.ids import uuid7
 from app.models.base import TimestampMixin, TenantMixin
 
+if TYPE_CHECKING:
+    from app.models.role import Role
+    from app.models.tenant import Tenant
+
 
 class User(Base, TimestampMixin, TenantMixin):
     """
@@ -19,17 +26,17 @@ class User(Base, TimestampMixin, TenantMixin):
 
     __tablename__ = "users"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    email = Column(String(255), nullable=False)
-    password_hash = Column(String(255), nullable=False)
-    first_name = Column(String(100), nullable=True)
-    last_name = Column(String(100), nullable=True)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    email: Mapped[str] = mapped_column(String(255), nullable=False)
+    password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
+    first_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    last_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
 
     # Role within tenant (admin, manager, user)
-    role = Column(String(50), nullable=False, default="user")
+    role: Mapped[str] = mapped_column(String(50), nullable=False, default="user")
     
     # Linked role from roles table
-    role_id = Column(
+    role_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("roles.id", ondelete="SET NULL"),
         nullable=True,
@@ -37,48 +44,57 @@ class User(Base, TimestampMixin, TenantMixin):
     )
 
     # Email verification
-    email_verified = Column(Boolean, default=False, nullable=False)
-    email_verified_at = Column(DateTime, nullable=True)
+    email_verified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    email_verified_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Status
-    is_active = Column(Boolean, default=True, nullable=False)
-    last_login_at = Column(DateTime, nullable=True)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    last_login_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Soft delete
-    deleted_at = Column(DateTime, nullable=True)
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Relationships
-    tenant = relationship("Tenant", back_populates="users")
-    user_role = relationship("Role")  # Changed backref name to avoid conflict with 'role' string
-    sessions = relationship("Session", back_populates="user", cascade="all, delete-orphan")
-    email_verifications = relationship(
+    tenant: Mapped["Tenant"] = relationship("Tenant", back_populates="users")
+    user_role: Mapped[Optional["Role"]] = relationship("Role")  # Changed backref name to avoid conflict with 'role' string
+    sessions: Mapped[List["Session"]] = relationship("Session", back_populates="user", cascade="all, delete-orphan")
+    email_verifications: Mapped[List["EmailVerification"]] = relationship(
         "EmailVerification", back_populates="user", cascade="all, delete-orphan"
     )
 
     # Unique constraint on tenant_id + email
     __table_args__ = (
+        UniqueConstraint("tenant_id", "email", name="uq_users_tenant_email"),
         {"postgresql_ignore_search_path": True},
     )
 
-    def __repr__(self):
-        return f"<User {self.email} ({self.role})>"
-
-    @property
+    @cached_property
     def full_name(self):
         if self.first_name and self.last_name:
             return f"{self.first_name} {self.last_name}"
         return self.email
 
 
+@event.listens_for(User.first_name, "set")
+@event.listens_for(User.last_name, "set")
+@event.listens_for(User.email, "set")
+def _reset_full_name(target, value, oldvalue, initiator):
+    """Drop the memoized full_name when one of its inputs changes"""
+    target.__dict__.pop("full_name", None)
+
+
 class Session(Base, TimestampMixin):
     """
     Session model for tracking user sessions and refresh tokens
     """
 
     __tablename__ = "sessions"
+    __table_args__ = (
+        Index("ix_sessions_user_active_expires", "user_id", "is_active", "expires_at"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
@@ -86,23 +102,21 @@ class Session(Base, TimestampMixin):
     )
 
     # Session details
-    refresh_token = Column(String(500), nullable=False, unique=True, index=True)
-    access_token = Column(String(500), nullable=True)
-    expires_at = Column(DateTime, nullable=False)
+    # SHA-256 digest of the refresh token; the raw token is never stored
+    refresh_token_hash: Mapped[bytes] = mapped_column(LargeBinary(32), nullable=False, unique=True, index=True)
+    access_token: Mapped[Optional[str]] = mapped_column(String(500), nullable=True, deferred=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
 
     # Device/client information
-    ip_address = Column(String(45), nullable=True)
-    user_agent = Column(Text, nullable=True)
+    ip_address: Mapped[Optional[str]] = mapped_column(String(45), nullable=True)
+    user_agent: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True)
 
     # Status
-    is_active = Column(Boolean, default=True, nullable=False)
-    revoked_at = Column(DateTime, nullable=True)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    revoked_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Relationships
-    user = relationship("User", back_populates="sessions")
-
-    def __repr__(self):
-        return f"<Session {self.user_id} - {self.is_active}>"
+    user: Mapped["User"] = relationship("User", back_populates="sessions")
 
 
 class EmailVerification(Base, TimestampMixin):
@@ -112,8 +126,8 @@ class EmailVerification(Base, TimestampMixin):
 
     __tablename__ = "email_verifications"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
@@ -121,17 +135,12 @@ class EmailVerification(Base, TimestampMixin):
     )
 
     # Token details
-    token = Column(String(255), nullable=False, unique=True, index=True)
-    expires_at = Column(DateTime, nullable=False)
+    token: Mapped[str] = mapped_column(String(255), nullable=False, unique=True, index=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
 
     # Status
-    is_used = Column(Boolean, default=False, nullable=False)
-    used_at = Column(DateTime, nullable=True)
+    is_used: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    used_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Relationships
-    user = relationship("User", back_populates="email_verifications")
-
-    def __repr__(self):
-        return f"<EmailVerification {self.user_id} - used:{self.is_used}>"
-
-
+    user: Mapped["User"] = relationship("User", back_populates="email_verifications")
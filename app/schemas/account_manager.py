@@ -1,5 +1,5 @@
 # app/schemas/account_manager.py
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, RootModel
 from typing import List
 
 class AccountManagerResponse(BaseModel):
@@ -8,8 +8,8 @@ class AccountManagerResponse(BaseModel):
     email: EmailStr
     isActive: bool
 
-class AccountManagerListResponse(BaseModel):
-    root: List[AccountManagerResponse]
+class AccountManagerListResponse(RootModel[List[AccountManagerResponse]]):
+    pass
 
 # ✅ Add this schema for creating new managers
 class AccountManagerCreateRequest(BaseModel):
@@ -4,7 +4,7 @@ Request and response models for authentication endpoints
 """
 from typing import Optional
 from uuid import UUID
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 import re
 
 
@@ -16,7 +16,8 @@ class RegisterRequest(BaseModel):
     companyName: str = Field(..., min_length=2)
     roleId: Optional[UUID] = None  # Optional: copy role from existing role
     
-    @validator('password')
+    @field_validator('password')
+    @classmethod
     def validate_password(cls, v):
         if not re.search(r'[A-Z]', v):
             raise ValueError('Password must contain at least one uppercase letter')
@@ -27,6 +28,8 @@ class RegisterRequest(BaseModel):
         return v
     
 class UserResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     email: str
     firstName: str
@@ -39,6 +42,8 @@ class UserResponse(BaseModel):
 
 
 class TenantResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     slug: str
@@ -49,6 +54,8 @@ class TenantResponse(BaseModel):
 
 
 class RegisterResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     user: UserResponse
     tenant: TenantResponse
     message: str
@@ -65,12 +72,16 @@ class LoginRequest(BaseModel):
 
 
 class TokensResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     accessToken: str
     refreshToken: str
     expiresIn: int
 
 
 class LoginResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     user: UserResponse
     tenant: TenantResponse
     tokens: TokensResponse
@@ -81,11 +92,7 @@ class RefreshTokenRequest(BaseModel):
 
 
 class TokenResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     accessToken: str
     expiresIn: int
-
-class ChangeRoleResponse(BaseModel):
-    message: str
-    userId: str
-    oldRole: str
-    newRole: str
\ No newline at end of file
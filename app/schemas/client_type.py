@@ -1,23 +1,18 @@
-from pydantic import BaseModel, constr, validator
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 
+from app.schemas.common import Code, Description, Name, Pagination
+
 class ClientTypeCreate(BaseModel):
-    code: constr(min_length=2)
-    name: constr(min_length=2)
-    description: constr(min_length=5)
-    paymentTerms: int
+    code: Code
+    name: Name
+    description: Description
+    paymentTerms: int = Field(..., ge=0)
     isActive: Optional[bool] = True
-    
-    @validator('paymentTerms')
-    def validate_payment_terms(cls, v):
-        if v < 0:
-            raise ValueError('Payment terms must be 0 or greater')
-        return v
-
-class ClientTypeUpdate(ClientTypeCreate):
-    pass
 
 class ClientTypeResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     code: str
     name: str
@@ -27,13 +22,8 @@ class ClientTypeResponse(BaseModel):
     createdAt: str
     updatedAt: str
 
-class Pagination(BaseModel):
-    total: int
-    page: int
-    limit: int
-    totalPages: int
-    hasMore: bool
-
 class ClientTypeListResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     data: List[ClientTypeResponse]
     pagination: Pagination
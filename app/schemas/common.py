@@ -0,0 +1,36 @@
+from typing import Annotated
+
+from pydantic import BaseModel, ConfigDict, StringConstraints
+
+# Indian tax/bank identifiers. Patterns accept either case and the value is
+# uppercased, all inside pydantic-core.
+GST_PATTERN = r'^[0-9]{2}[A-Za-z]{5}[0-9]{4}[A-Za-z][1-9A-Za-z][Zz][0-9A-Za-z]$'
+PAN_PATTERN = r'^[A-Za-z]{5}[0-9]{4}[A-Za-z]$'
+IFSC_PATTERN = r'^[A-Za-z]{4}0[A-Za-z0-9]{6}$'
+GST_STATE_CODE_PATTERN = r'^(0[1-9]|[12][0-9]|3[0-7])$'
+# Syntax-only email check for customer contacts; no email-validator parsing or
+# normalization, so identity fields (users, tenants) keep EmailStr. Domain
+# labels must be non-empty and may not start or end with a hyphen.
+EMAIL_PATTERN = r'^[^@\s]+@(?:[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+(?:[A-Za-z]{2,63}|xn--[A-Za-z0-9-]{1,59})$'
+
+GSTNumber = Annotated[str, StringConstraints(to_upper=True, pattern=GST_PATTERN, min_length=15, max_length=15)]
+PANNumber = Annotated[str, StringConstraints(to_upper=True, pattern=PAN_PATTERN, min_length=10, max_length=10)]
+IFSCCode = Annotated[str, StringConstraints(to_upper=True, pattern=IFSC_PATTERN, min_length=11, max_length=11)]
+GSTStateCode = Annotated[str, StringConstraints(pattern=GST_STATE_CODE_PATTERN)]
+Email = Annotated[str, StringConstraints(pattern=EMAIL_PATTERN, max_length=254)]
+
+# Code/name/description of the service type and client type masters
+Code = Annotated[str, StringConstraints(min_length=2)]
+Name = Annotated[str, StringConstraints(min_length=2)]
+Description = Annotated[str, StringConstraints(min_length=5)]
+
+
+class Pagination(BaseModel):
+    """Pagination metadata shared by every list response"""
+    model_config = ConfigDict(frozen=True)
+
+    total: int
+    page: int
+    limit: int
+    totalPages: int
+    hasMore: bool
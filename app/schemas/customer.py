@@ -1,14 +1,21 @@
-from pydantic import BaseModel, EmailStr, Field, validator
-from typing import Optional, List
-import re
-from uuid import UUID
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, model_validator
+from typing import Annotated, Optional, List
 
+from app.schemas.common import Email, GSTNumber, PANNumber, Pagination
 
-def _strip_or_none(value: Optional[str]) -> Optional[str]:
-    if value is None:
-        return None
-    stripped = value.strip()
-    return stripped if stripped else None
+# Stripping and length checks run inside pydantic-core
+StrippedStr = Annotated[str, StringConstraints(strip_whitespace=True)]
+NonEmptyStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+PaymentTerms = Annotated[int, Field(ge=0)]
+
+
+def _check_gst_exemption(self):
+    # Only touch a reason that was sent, so exclude_unset updates stay clean
+    if self.gstExemptionReason == "":
+        self.gstExemptionReason = None
+    if self.gstExempted and not self.gstExemptionReason:
+        raise ValueError('GST exemption reason is required when GST is exempted')
+    return self
 
 
 class CustomerCreate(BaseModel):
@@ -19,55 +26,20 @@ class CustomerCreate(BaseModel):
     addressLine3: Optional[str] = Field(None, min_length=2)
     state: str = Field(..., min_length=2)
     country: str = Field(..., min_length=2)
-    email: EmailStr
+    email: Email
     whatsapp: str = Field(..., min_length=10)
     phone: str = Field(..., min_length=10)
-    contactPerson: str = Field(..., min_length=2)
+    contactPerson: NonEmptyStr = Field(..., min_length=2)
     customerNote: Optional[str] = None
-    gstNumber: Optional[str] = Field(None, min_length=15, max_length=15)
-    panNumber: Optional[str] = Field(None, min_length=10, max_length=10)
+    gstNumber: Optional[GSTNumber] = None
+    panNumber: Optional[PANNumber] = None
     gstExempted: bool = False
-    gstExemptionReason: Optional[str] = None
-    paymentTerms: int
+    gstExemptionReason: Optional[StrippedStr] = None
+    paymentTerms: PaymentTerms
     isActive: bool = True
     
-    @validator('gstNumber')
-    def validate_gst_number(cls, v):
-        if v:
-            pattern = r'^[0-9]{2}[A-Z]{5}[0-9]{4}[A-Z]{1}[1-9A-Z]{1}Z[0-9A-Z]{1}$'
-            if not re.match(pattern, v):
-                raise ValueError('Invalid GST number format')
-        return v
-    
-    @validator('panNumber')
-    def validate_pan_number(cls, v):
-        if v:
-            pattern = r'^[A-Z]{5}[0-9]{4}[A-Z]{1}$'
-            if not re.match(pattern, v):
-                raise ValueError('Invalid PAN number format')
-        return v
-    
-    @validator('paymentTerms')
-    def validate_payment_terms(cls, v):
-        if v < 0:
-            raise ValueError('Payment terms must be 0 or greater')
-        return v
-    
-    @validator('contactPerson')
-    def validate_contact_person(cls, v):
-        cleaned = _strip_or_none(v)
-        if not cleaned:
-            raise ValueError('Contact person cannot be empty')
-        return cleaned
-    
-    @validator('gstExemptionReason', always=True)
-    def validate_gst_exemption_reason(cls, v, values):
-        cleaned = _strip_or_none(v)
-        if values.get('gstExempted'):
-            if not cleaned:
-                raise ValueError('GST exemption reason is required when GST is exempted')
-            return cleaned
-        return cleaned
+    # Shared with CustomerUpdate
+    check_gst_exemption = model_validator(mode='after')(_check_gst_exemption)
 
 
 class CustomerUpdate(BaseModel):
@@ -78,60 +50,25 @@ class CustomerUpdate(BaseModel):
     addressLine3: Optional[str] = Field(None, min_length=2)
     state: Optional[str] = Field(None, min_length=2)
     country: Optional[str] = Field(None, min_length=2)
-    email: Optional[EmailStr] = None
+    email: Optional[Email] = None
     whatsapp: Optional[str] = Field(None, min_length=10)
     phone: Optional[str] = Field(None, min_length=10)
-    contactPerson: Optional[str] = Field(None, min_length=2)
+    contactPerson: Optional[NonEmptyStr] = Field(None, min_length=2)
     customerNote: Optional[str] = None
-    gstNumber: Optional[str] = Field(None, min_length=15, max_length=15)
-    panNumber: Optional[str] = Field(None, min_length=10, max_length=10)
+    gstNumber: Optional[GSTNumber] = None
+    panNumber: Optional[PANNumber] = None
     gstExempted: Optional[bool] = None
-    gstExemptionReason: Optional[str] = None
-    paymentTerms: Optional[int] = None
+    gstExemptionReason: Optional[StrippedStr] = None
+    paymentTerms: Optional[PaymentTerms] = None
     isActive: Optional[bool] = None
     
-    @validator('gstNumber')
-    def validate_gst_number(cls, v):
-        if v:
-            pattern = r'^[0-9]{2}[A-Z]{5}[0-9]{4}[A-Z]{1}[1-9A-Z]{1}Z[0-9A-Z]{1}$'
-            if not re.match(pattern, v):
-                raise ValueError('Invalid GST number format')
-        return v
-    
-    @validator('panNumber')
-    def validate_pan_number(cls, v):
-        if v:
-            pattern = r'^[A-Z]{5}[0-9]{4}[A-Z]{1}$'
-            if not re.match(pattern, v):
-                raise ValueError('Invalid PAN number format')
-        return v
-    
-    @validator('paymentTerms')
-    def validate_payment_terms(cls, v):
-        if v is not None and v < 0:
-            raise ValueError('Payment terms must be 0 or greater')
-        return v
-    
-    @validator('contactPerson')
-    def validate_contact_person(cls, v):
-        if v is None:
-            return v
-        cleaned = _strip_or_none(v)
-        if not cleaned:
-            raise ValueError('Contact person cannot be empty')
-        return cleaned
-    
-    @validator('gstExemptionReason', always=True)
-    def validate_gst_exemption_reason(cls, v, values):
-        cleaned = _strip_or_none(v)
-        if values.get('gstExempted'):
-            if not cleaned:
-                raise ValueError('GST exemption reason is required when GST is exempted')
-            return cleaned
-        return cleaned
+    # Shared with CustomerCreate
+    check_gst_exemption = model_validator(mode='after')(_check_gst_exemption)
 
 
 class CustomerResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     code: str
     name: str
@@ -155,13 +92,6 @@ class CustomerResponse(BaseModel):
     updatedAt: str
 
 
-class Pagination(BaseModel):
-    total: int
-    page: int
-    limit: int
-    totalPages: int
-    hasMore: bool
-
 class CustomerListResponse(BaseModel):
     data: List[CustomerResponse]
     pagination: Pagination
\ No newline at end of file
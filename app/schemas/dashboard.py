@@ -3,10 +3,31 @@ Dashboard Pydantic Schemas
 Dashboard API responses-inu vendi schemas
 """
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from decimal import Decimal
 
 
+# OpenAPI examples - row models um list responses um share cheyyunnu
+_MONTHLY_REVENUE_EXAMPLES = [
+    {"month": "Jan", "revenue": 4000.00, "previousYearRevenue": 2400.00},
+    {"month": "Feb", "revenue": 3000.00, "previousYearRevenue": 1398.00}
+]
+
+_AGING_EXAMPLES = [
+    {"range": "0-30", "amount": 4000.00, "count": 15},
+    {"range": "31-60", "amount": 3000.00, "count": 8},
+    {"range": "61-90", "amount": 2000.00, "count": 5},
+    {"range": "90+", "amount": 1000.00, "count": 2}
+]
+
+_CUSTOMER_REVENUE_EXAMPLES = [
+    {"type": "Enterprise", "revenue": 4000.00, "percentage": 40.0},
+    {"type": "SMB", "revenue": 3000.00, "percentage": 30.0},
+    {"type": "Startup", "revenue": 2000.00, "percentage": 20.0},
+    {"type": "Individual", "revenue": 1000.00, "percentage": 10.0}
+]
+
+
 # 2.1 Dashboard Metrics Response
 class DashboardMetrics(BaseModel):
     """
@@ -20,8 +41,9 @@ class DashboardMetrics(BaseModel):
     totalCreditNotes: Decimal = Field(..., description="Total credit notes issued")
     currency: str = Field(..., description="Company currency code", max_length=3)
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "totalReceivables": 1234567.50,
                 "totalRevenue": 2345678.00,
@@ -31,6 +53,7 @@ class DashboardMetrics(BaseModel):
                 "currency": "INR"
             }
         }
+    )
 
 
 # 2.2 Revenue Trend Response
@@ -43,14 +66,10 @@ class MonthlyRevenue(BaseModel):
     revenue: Decimal = Field(..., description="Current year revenue")
     previousYearRevenue: Decimal = Field(..., description="Previous year revenue")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "month": "Jan",
-                "revenue": 4000.00,
-                "previousYearRevenue": 2400.00
-            }
-        }
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={"example": _MONTHLY_REVENUE_EXAMPLES[0]}
+    )
 
 
 class RevenueTrendResponse(BaseModel):
@@ -61,14 +80,7 @@ class RevenueTrendResponse(BaseModel):
     data: List[MonthlyRevenue]
 
     class Config:
-        json_schema_extra = {
-            "example": {
-                "data": [
-                    {"month": "Jan", "revenue": 4000.00, "previousYearRevenue": 2400.00},
-                    {"month": "Feb", "revenue": 3000.00, "previousYearRevenue": 1398.00}
-                ]
-            }
-        }
+        json_schema_extra = {"example": {"data": _MONTHLY_REVENUE_EXAMPLES}}
 
 
 # 2.3 Aging Analysis Response
@@ -81,14 +93,10 @@ class AgingBucket(BaseModel):
     amount: Decimal = Field(..., description="Total amount in this bucket")
     count: int = Field(..., description="Number of invoices in bucket")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "range": "0-30",
-                "amount": 4000.00,
-                "count": 15
-            }
-        }
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={"example": _AGING_EXAMPLES[0]}
+    )
 
 
 class AgingAnalysisResponse(BaseModel):
@@ -99,16 +107,7 @@ class AgingAnalysisResponse(BaseModel):
     data: List[AgingBucket]
 
     class Config:
-        json_schema_extra = {
-            "example": {
-                "data": [
-                    {"range": "0-30", "amount": 4000.00, "count": 15},
-                    {"range": "31-60", "amount": 3000.00, "count": 8},
-                    {"range": "61-90", "amount": 2000.00, "count": 5},
-                    {"range": "90+", "amount": 1000.00, "count": 2}
-                ]
-            }
-        }
+        json_schema_extra = {"example": {"data": _AGING_EXAMPLES}}
 
 
 # 2.4 Customer Revenue Response
@@ -121,14 +120,10 @@ class CustomerTypeRevenue(BaseModel):
     revenue: Decimal = Field(..., description="Total revenue from this type")
     percentage: float = Field(..., description="Percentage of total revenue")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "type": "Enterprise",
-                "revenue": 4000.00,
-                "percentage": 40.0
-            }
-        }
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={"example": _CUSTOMER_REVENUE_EXAMPLES[0]}
+    )
 
 
 class CustomerRevenueResponse(BaseModel):
@@ -139,16 +134,7 @@ class CustomerRevenueResponse(BaseModel):
     data: List[CustomerTypeRevenue]
 
     class Config:
-        json_schema_extra = {
-            "example": {
-                "data": [
-                    {"type": "Enterprise", "revenue": 4000.00, "percentage": 40.0},
-                    {"type": "SMB", "revenue": 3000.00, "percentage": 30.0},
-                    {"type": "Startup", "revenue": 2000.00, "percentage": 20.0},
-                    {"type": "Individual", "revenue": 1000.00, "percentage": 10.0}
-                ]
-            }
-        }
+        json_schema_extra = {"example": {"data": _CUSTOMER_REVENUE_EXAMPLES}}
 
 
 # Query Parameters
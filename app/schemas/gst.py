@@ -1,22 +1,21 @@
-from pydantic import BaseModel, validator
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from typing import Literal, Optional, List
 from datetime import date
 import re
 
+# GST format: 29ABCDE1234F1Z5
+_GST_RE = re.compile(r'^[0-9]{2}[A-Z]{5}[0-9]{4}[A-Z][1-9A-Z]Z[0-9A-Z]$')
+
 # Tax Rate Schemas
 class TaxRateCreate(BaseModel):
     category: str
-    rate: float
+    rate: float = Field(..., ge=0, le=100)
     effectiveFrom: date
     description: Optional[str] = None
-    
-    @validator('rate')
-    def validate_rate(cls, v):
-        if v < 0 or v > 100:
-            raise ValueError('Tax rate must be between 0 and 100')
-        return v
 
 class TaxRateResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     category: str
     rate: float
@@ -28,43 +27,30 @@ class GSTSettingsCreate(BaseModel):
     isGstApplicable: bool
     gstNumber: Optional[str] = None
     effectiveDate: date
-    defaultRate: float
-    displayFormat: str
-    filingFrequency: str
+    defaultRate: float = Field(..., ge=0, le=100)
+    displayFormat: Literal['Inclusive', 'Exclusive']
+    filingFrequency: Literal['MONTHLY', 'QUARTERLY', 'ANNUALLY']
     taxRates: Optional[List[TaxRateCreate]] = []
     
-    @validator('gstNumber')
-    def validate_gst_number(cls, v, values):
-        if values.get('isGstApplicable') and not v:
-            raise ValueError('GST number is required when GST is applicable')
+    @field_validator('gstNumber')
+    @classmethod
+    def validate_gst_number(cls, v):
         if v:
             if len(v) != 15:
                 raise ValueError('GST number must be exactly 15 characters')
-            # GST format: 29ABCDE1234F1Z5
-            pattern = r'^[0-9]{2}[A-Z]{5}[0-9]{4}[A-Z]{1}[1-9A-Z]{1}Z[0-9A-Z]{1}$'
-            if not re.match(pattern, v):
+            if not _GST_RE.match(v):
                 raise ValueError('Invalid GST number format')
         return v
     
-    @validator('defaultRate')
-    def validate_default_rate(cls, v):
-        if v < 0 or v > 100:
-            raise ValueError('Default rate must be between 0 and 100')
-        return v
-    
-    @validator('displayFormat')
-    def validate_display_format(cls, v):
-        if v not in ['Inclusive', 'Exclusive']:
-            raise ValueError('Display format must be either Inclusive or Exclusive')
-        return v
-    
-    @validator('filingFrequency')
-    def validate_filing_frequency(cls, v):
-        if v not in ['MONTHLY', 'QUARTERLY', 'ANNUALLY']:
-            raise ValueError('Filing frequency must be MONTHLY, QUARTERLY, or ANNUALLY')
-        return v
+    @model_validator(mode='after')
+    def check_gst_number_required(self):
+        if self.isGstApplicable and not self.gstNumber:
+            raise ValueError('GST number is required when GST is applicable')
+        return self
 
 class GSTSettingsResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     isGstApplicable: bool
     gstNumber: Optional[str] = None
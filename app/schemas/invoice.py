@@ -1,35 +1,25 @@
-from pydantic import BaseModel, validator
-from typing import Optional, List
-from datetime import date
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, model_validator
+from typing import Annotated, Optional, List
+from typing_extensions import NotRequired, TypedDict
+from datetime import date, datetime
 from decimal import Decimal
 
+from app.schemas.common import Pagination
+
 # Line Item Schemas
-class InvoiceLineItemCreate(BaseModel):
+# TypedDict (not BaseModel): items stay plain dicts after validation,
+# bounds are checked in pydantic-core. Money fields are Decimal, sized like
+# their DECIMAL columns
+class InvoiceLineItemCreate(TypedDict):
     serviceType: str  # UUID
-    description: Optional[str] = None
-    quantity: float
-    rate: float
-    taxRate: float
-    
-    @validator('quantity')
-    def validate_quantity(cls, v):
-        if v < 1:
-            raise ValueError('Quantity must be at least 1')
-        return v
-    
-    @validator('rate')
-    def validate_rate(cls, v):
-        if v < 0:
-            raise ValueError('Rate must be 0 or greater')
-        return v
-    
-    @validator('taxRate')
-    def validate_tax_rate(cls, v):
-        if v < 0 or v > 100:
-            raise ValueError('Tax rate must be between 0 and 100')
-        return v
+    description: NotRequired[Optional[str]]
+    quantity: Annotated[Decimal, Field(ge=1, max_digits=10, decimal_places=2)]
+    rate: Annotated[Decimal, Field(ge=0, max_digits=15, decimal_places=2)]
+    taxRate: Annotated[Decimal, Field(ge=0, le=100, max_digits=5, decimal_places=2)]
 
 class InvoiceLineItemResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     serviceType: str
     serviceTypeName: str
@@ -47,45 +37,26 @@ class InvoiceCreate(BaseModel):
     invoiceDate: date
     customerId: str  # UUID
     dueDate: date
-    referenceNumber: Optional[str] = None
-    lineItems: List[InvoiceLineItemCreate]
-    notes: Optional[str] = None
-    
-    @validator('lineItems')
-    def validate_line_items(cls, v):
-        if len(v) < 1:
-            raise ValueError('At least one line item is required')
-        return v
+    referenceNumber: Optional[str] = Field(None, max_length=100)
+    lineItems: List[InvoiceLineItemCreate] = Field(..., min_length=1)
+    notes: Optional[str] = Field(None, max_length=1000)
     
-    @validator('dueDate')
-    def validate_due_date(cls, v, values):
-        if 'invoiceDate' in values and v < values['invoiceDate']:
+    @model_validator(mode='after')
+    def check_due_date(self):
+        if self.dueDate < self.invoiceDate:
             raise ValueError('Due date must be on or after invoice date')
-        return v
-    
-    @validator('referenceNumber')
-    def validate_reference_number(cls, v):
-        if v and len(v) > 100:
-            raise ValueError('Reference number must be 100 characters or less')
-        return v
-    
-    @validator('notes')
-    def validate_notes(cls, v):
-        if v and len(v) > 1000:
-            raise ValueError('Notes must be 1000 characters or less')
-        return v
-
-class InvoiceUpdate(InvoiceCreate):
-    pass
+        return self
 
 class InvoiceResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     invoiceNumber: str
-    invoiceDate: str
+    invoiceDate: date
     customerId: str
     customerName: str
     customerGst: Optional[str] = None
-    dueDate: str
+    dueDate: date
     referenceNumber: Optional[str] = None
     lineItems: List[InvoiceLineItemResponse]
     subtotal: float
@@ -93,17 +64,12 @@ class InvoiceResponse(BaseModel):
     total: float
     status: str  # Paid, Pending, Overdue
     notes: Optional[str] = None
-    createdAt: str
-    updatedAt: str
-
-class Pagination(BaseModel):
-    total: int
-    page: int
-    limit: int
-    totalPages: int
-    hasMore: bool
+    createdAt: datetime
+    updatedAt: datetime
 
 class InvoiceListResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     data: List[InvoiceResponse]
     pagination: Pagination
 
@@ -116,7 +82,16 @@ class EmailInvoiceRequest(BaseModel):
     includePaymentLink: Optional[bool] = False
 
 class EmailInvoiceResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     success: bool
     message: str
     sentTo: str
     sentAt: str
+
+# Raw-body parsing: JSON bytes are validated inside pydantic-core without
+# building an intermediate dict (nested lineItems included)
+_INVOICE_CREATE_ADAPTER = TypeAdapter(InvoiceCreate)
+
+def parse_invoice_bytes(body: bytes) -> InvoiceCreate:
+    return _INVOICE_CREATE_ADAPTER.validate_json(body)
@@ -1,20 +1,30 @@
-from pydantic import BaseModel, validator
-from typing import Optional, List
-from datetime import date
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, TypeAdapter, field_validator
+from typing import Annotated, Literal, Optional, List
+from typing_extensions import TypedDict
+from datetime import date, datetime
 from decimal import Decimal
 
+from app.schemas.common import Pagination
+
+
+def _lower(v):
+    return v.lower() if isinstance(v, str) else v
+
+# Matched case-insensitively, stored lowercase
+PaymentMethod = Annotated[
+    Literal['bank_transfer', 'cheque', 'cash', 'upi', 'card'],
+    BeforeValidator(_lower)
+]
+
 # Receipt Allocation Schemas
-class ReceiptAllocationCreate(BaseModel):
+# TypedDict (not BaseModel): allocations stay plain dicts after validation
+class ReceiptAllocationCreate(TypedDict):
     invoiceId: str  # UUID
-    amountAllocated: float
-    
-    @validator('amountAllocated')
-    def validate_amount_allocated(cls, v):
-        if v < 0.01:
-            raise ValueError('Amount allocated must be at least 0.01')
-        return v
+    amountAllocated: Annotated[Decimal, Field(ge=Decimal('0.01'), max_digits=15, decimal_places=2)]
 
 class ReceiptAllocationResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     invoiceId: str
     invoiceNumber: str
     amountAllocated: float
@@ -24,46 +34,26 @@ class ReceiptCreate(BaseModel):
     receiptId: Optional[str] = None  # Auto-generated if not provided
     receiptDate: date
     customerId: str  # UUID
-    paymentMethod: str
-    amountReceived: float
-    allocations: List[ReceiptAllocationCreate]
-    notes: Optional[str] = None
+    paymentMethod: PaymentMethod
+    amountReceived: Decimal = Field(..., ge=1, max_digits=15, decimal_places=2)
+    allocations: List[ReceiptAllocationCreate] = Field(..., min_length=1)
+    notes: Optional[str] = Field(None, max_length=1000)
     
-    @validator('receiptDate')
-    def validate_receipt_date(cls, v):
-        if v > date.today():
+    @field_validator('receiptDate')
+    @classmethod
+    def validate_receipt_date(cls, v, info):
+        # Bulk callers can pass context={'today': ...} to read the clock once
+        today = (info.context or {}).get('today') or date.today()
+        if v > today:
             raise ValueError('Receipt date cannot be in the future')
         return v
-    
-    @validator('paymentMethod')
-    def validate_payment_method(cls, v):
-        valid_methods = ['bank_transfer', 'cheque', 'cash', 'upi', 'card']
-        if v.lower() not in valid_methods:
-            raise ValueError(f'Payment method must be one of: {", ".join(valid_methods)}')
-        return v.lower()
-    
-    @validator('amountReceived')
-    def validate_amount_received(cls, v):
-        if v < 1:
-            raise ValueError('Amount received must be at least 1')
-        return v
-    
-    @validator('allocations')
-    def validate_allocations(cls, v):
-        if len(v) < 1:
-            raise ValueError('At least one allocation is required')
-        return v
-    
-    @validator('notes')
-    def validate_notes(cls, v):
-        if v and len(v) > 1000:
-            raise ValueError('Notes must be 1000 characters or less')
-        return v
 
 class ReceiptResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     receiptId: str
-    receiptDate: str
+    receiptDate: date
     customerId: str
     customerName: str
     paymentMethod: str
@@ -73,18 +63,20 @@ class ReceiptResponse(BaseModel):
     unappliedAmount: float
     notes: Optional[str] = None
     status: str
-    createdAt: str
+    createdAt: datetime
 
 class ReceiptCreateResponse(ReceiptResponse):
     invoicesUpdated: List[str]
 
-class Pagination(BaseModel):
-    total: int
-    page: int
-    limit: int
-    totalPages: int
-    hasMore: bool
-
 class ReceiptListResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     data: List[ReceiptResponse]
     pagination: Pagination
+
+# Raw-body parsing: JSON bytes are validated inside pydantic-core without
+# building an intermediate dict (nested allocations included)
+_RECEIPT_CREATE_ADAPTER = TypeAdapter(ReceiptCreate)
+
+def parse_receipt_bytes(body: bytes) -> ReceiptCreate:
+    return _RECEIPT_CREATE_ADAPTER.validate_json(body)
@@ -1,23 +1,18 @@
-from pydantic import BaseModel, constr, validator
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 
+from app.schemas.common import Code, Description, Name, Pagination
+
 class ServiceTypeCreate(BaseModel):
-    code: constr(min_length=2)
-    name: constr(min_length=2)
-    description: constr(min_length=5)
-    taxRate: float
+    code: Code
+    name: Name
+    description: Description
+    taxRate: float = Field(..., ge=0, le=100)
     isActive: Optional[bool] = True
-    
-    @validator('taxRate')
-    def validate_tax_rate(cls, v):
-        if v < 0 or v > 100:
-            raise ValueError('Tax rate must be between 0 and 100')
-        return v
-
-class ServiceTypeUpdate(ServiceTypeCreate):
-    pass
 
 class ServiceTypeResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     code: str
     name: str
@@ -27,13 +22,8 @@ class ServiceTypeResponse(BaseModel):
     createdAt: str
     updatedAt: str
 
-class Pagination(BaseModel):
-    total: int
-    page: int
-    limit: int
-    totalPages: int
-    hasMore: bool
-
 class ServiceTypeListResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     data: List[ServiceTypeResponse]
     pagination: Pagination
@@ -3,7 +3,7 @@ User Pydantic schemas for user management
 """
 from typing import Optional, List
 from uuid import UUID
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 
 class UserBase(BaseModel):
@@ -30,6 +30,8 @@ class UserUpdate(BaseModel):
 
 
 class UserResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     email: str
     firstName: str
@@ -44,6 +46,8 @@ class UserResponse(BaseModel):
 
 
 class UserListResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     data: List[UserResponse]
 
 
@@ -52,6 +56,8 @@ class ChangeUserRoleRequest(BaseModel):
 
 
 class ChangeRoleResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     message: str
     userId: str
     oldRole: str
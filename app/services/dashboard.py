@@ -3,10 +3,13 @@ Dashboard Service Layer
 Business logic for dashboard operations
 CRUD um API endpoint um-idakk ulla layer
 """
+import heapq
 from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
 from datetime import datetime
+from decimal import Context, Decimal
 
+from app.core.cache import get_dashboard_cached
 from app.crud.dashboard import DashboardCRUD
 from app.schemas.dashboard import (
     DashboardMetrics,
@@ -15,6 +18,40 @@ from app.schemas.dashboard import (
     CustomerTypeRevenue
 )
 
+# Money is quantized once here, so the response models (built with
+# model_construct) never run pydantic's Decimal parsing on the way out
+_CENTS = Decimal("0.01")
+_MONEY_CONTEXT = Context(prec=18)
+
+_VALID_PERIODS = frozenset(('month', 'quarter', 'year', 'all'))
+
+
+def _money(value: Any) -> Decimal:
+    """Quantize a DB aggregate to 2 decimal places"""
+    if not isinstance(value, Decimal):
+        value = Decimal(str(value))
+    return value.quantize(_CENTS, context=_MONEY_CONTEXT)
+
+
+def _largest_remainder_percentages(amounts: List[Decimal]) -> List[float]:
+    """
+    Percentage share (2 dp) of each amount, summing to exactly 100
+    
+    Hamilton method: every share is floored to basis points (0.01%), then
+    the leftover points go to the shares with the largest remainders.
+    """
+    total = sum(amounts)
+    if not total:
+        return [0.0] * len(amounts)
+    
+    shares = [amount * 10000 / total for amount in amounts]
+    points = [int(share) for share in shares]
+    leftover = 10000 - sum(points)
+    for i in heapq.nlargest(leftover, range(len(shares)), key=lambda i: shares[i] - points[i]):
+        points[i] += 1
+    
+    return [p / 100 for p in points]
+
 
 class DashboardService:
     """
@@ -28,30 +65,21 @@ class DashboardService:
         Dashboard-ile main metrics fetch cheyyunnu
         Top-il kanikkunna 6 cards-inu data
         
-        Ivde ellam parallel queries alla, sequential aanu
-        Real production-il parallel queries use cheyyam performance-inu
+        Ella metrics um oru single query-il (one DB round-trip)
         """
-        # Get financial year start
-        fy_start = DashboardCRUD.get_financial_year_start(db, tenant_id)
-        
-        # Fetch all metrics
-        # Ividuthe preshnam: oru oru metric-inum separate query
-        # Optimization: Single complex query with multiple aggregations
-        total_receivables = DashboardCRUD.get_total_receivables(db, tenant_id)
-        total_revenue = DashboardCRUD.get_total_revenue(db, tenant_id, fy_start)
-        avg_collection = DashboardCRUD.get_average_collection_period(db, tenant_id)
-        pending_count = DashboardCRUD.get_pending_invoices_count(db, tenant_id)
-        total_credit = DashboardCRUD.get_total_credit_notes(db, tenant_id)
-        currency = DashboardCRUD.get_currency(db, tenant_id)
+        metrics = get_dashboard_cached(
+            tenant_id, 'metrics', (),
+            lambda: DashboardCRUD.get_all_metrics(db, tenant_id)
+        )
         
         # Build response schema
-        return DashboardMetrics(
-            totalReceivables=total_receivables,
-            totalRevenue=total_revenue,
-            averageCollectionPeriod=avg_collection,
-            pendingInvoices=pending_count,
-            totalCreditNotes=total_credit,
-            currency=currency
+        return DashboardMetrics.model_construct(
+            totalReceivables=_money(metrics['total_receivables']),
+            totalRevenue=_money(metrics['total_revenue']),
+            averageCollectionPeriod=metrics['average_collection_period'],
+            pendingInvoices=metrics['pending_invoices'],
+            totalCreditNotes=_money(metrics['total_credit_notes']),
+            currency=metrics['currency']
         )
 
     @staticmethod
@@ -77,16 +105,19 @@ class DashboardService:
             year = datetime.now().year
         
         # Fetch trend data from CRUD
-        trend_data = DashboardCRUD.get_monthly_revenue_trend(
-            db, tenant_id, year, months
+        trend_data = get_dashboard_cached(
+            tenant_id, 'revenue-trend', (year, months),
+            lambda: DashboardCRUD.get_monthly_revenue_trend(
+                db, tenant_id, year, months
+            )
         )
         
         # Convert to Pydantic models
         return [
-            MonthlyRevenue(
+            MonthlyRevenue.model_construct(
                 month=item['month'],
-                revenue=item['revenue'],
-                previousYearRevenue=item['previousYearRevenue']
+                revenue=_money(item['revenue']),
+                previousYearRevenue=_money(item['previousYearRevenue'])
             )
             for item in trend_data
         ]
@@ -102,13 +133,16 @@ class DashboardService:
         - Group by days overdue
         - Always return 4 buckets (zero fill if empty)
         """
-        aging_data = DashboardCRUD.get_aging_analysis(db, tenant_id)
+        aging_data = get_dashboard_cached(
+            tenant_id, 'aging', (),
+            lambda: DashboardCRUD.get_aging_analysis(db, tenant_id)
+        )
         
         # Convert to Pydantic models
         return [
-            AgingBucket(
+            AgingBucket.model_construct(
                 range=item['range'],
-                amount=item['amount'],
+                amount=_money(item['amount']),
                 count=item['count']
             )
             for item in aging_data
@@ -131,37 +165,31 @@ class DashboardService:
         - all: All time revenue
         """
         # Validate period
-        valid_periods = ['month', 'quarter', 'year', 'all']
-        if period not in valid_periods:
+        if period not in _VALID_PERIODS:
             period = 'all'
         
         # Fetch revenue breakdown
-        revenue_data = DashboardCRUD.get_customer_revenue_breakdown(
-            db, tenant_id, period
+        revenue_data = get_dashboard_cached(
+            tenant_id, 'customer-revenue', (period,),
+            lambda: DashboardCRUD.get_customer_revenue_breakdown(
+                db, tenant_id, period
+            )
         )
         
+        # Business validation: percentages always sum to exactly 100
+        # (largest-remainder rounding, so the error never lands on one slice)
+        revenues = [_money(item['revenue']) for item in revenue_data]
+        percentages = _largest_remainder_percentages(revenues)
+        
         # Convert to Pydantic models
-        result = [
-            CustomerTypeRevenue(
+        return [
+            CustomerTypeRevenue.model_construct(
                 type=item['type'],
-                revenue=item['revenue'],
-                percentage=item['percentage']
+                revenue=revenue,
+                percentage=percentage
             )
-            for item in revenue_data
+            for item, revenue, percentage in zip(revenue_data, revenues, percentages)
         ]
-        
-        # Business validation: Ensure percentages sum to 100
-        # (May have rounding errors, but close to 100)
-        total_percentage = sum(item.percentage for item in result)
-        
-        # If percentages don't add up, adjust the largest one
-        # Production-il better rounding algorithm use cheyyam
-        if result and abs(total_percentage - 100.0) > 0.01:
-            diff = 100.0 - total_percentage
-            result[0].percentage += diff
-            result[0].percentage = round(result[0].percentage, 2)
-        
-        return result
 
     @staticmethod
     def validate_dashboard_access(db: Session, tenant_id: int) -> bool:
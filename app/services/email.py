@@ -15,6 +15,7 @@ MAIL_FROM = os.getenv("MAIL_FROM")
 MAIL_SERVER = os.getenv("MAIL_SERVER", "smtp.gmail.com")
 MAIL_PORT = int(os.getenv("MAIL_PORT", "587"))
 MAIL_USE_TLS = os.getenv("MAIL_USE_TLS", "True").lower() == "true"
+FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:3000")
 
 # Check if email is configured
 EMAIL_ENABLED = all([MAIL_USERNAME, MAIL_PASSWORD, MAIL_FROM])
@@ -56,7 +57,7 @@ async def send_verification_email(email: str, token: str) -> bool:
     
     try:
         # Your verification URL
-        verification_url = f"{os.getenv('FRONTEND_URL', 'http://localhost:3000')}/verify?token={token}"
+        verification_url = f"{FRONTEND_URL}/verify?token={token}"
         
         message = MessageSchema(
             subject="Verify Your Email",
@@ -94,7 +95,7 @@ async def send_password_reset_email(email: str, token: str) -> bool:
         return False
     
     try:
-        reset_url = f"{os.getenv('FRONTEND_URL', 'http://localhost:3000')}/reset-password?token={token}"
+        reset_url = f"{FRONTEND_URL}/reset-password?token={token}"
         
         message = MessageSchema(
             subject="Reset Your Password",
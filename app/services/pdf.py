@@ -1,11 +1,92 @@
+from reportlab import rl_config
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib import colors
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+from reportlab.platypus import SimpleDocTemplate, Table, LongTable, TableStyle, Paragraph, Spacer, KeepTogether
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_RIGHT, TA_LEFT
 from io import BytesIO
-from datetime import datetime
+from collections import OrderedDict
+from threading import Lock
+from typing import BinaryIO, Optional
+
+import orjson
+
+from app.core.config import settings
+
+# Attribute validation on drawing objects is only worth paying for while debugging
+rl_config.shapeChecking = 1 if settings.DEBUG else 0
+
+# Rendered invoice PDFs keyed by their canonical payload, least recently used first
+_PDF_CACHE: "OrderedDict[bytes, bytes]" = OrderedDict()
+_PDF_CACHE_SIZE = 0
+_PDF_CACHE_LOCK = Lock()
+
+# Styles are immutable once built, so they are shared across every PDF
+_STYLES = getSampleStyleSheet()
+_NORMAL_STYLE = _STYLES['Normal']
+
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=24,
+    textColor=colors.HexColor('#4F46E5'),
+    spaceAfter=30,
+    alignment=TA_CENTER
+)
+
+_HEADING_STYLE = ParagraphStyle(
+    'CustomHeading',
+    parent=_STYLES['Heading2'],
+    fontSize=14,
+    textColor=colors.HexColor('#1F2937'),
+    spaceAfter=12
+)
+
+
+_INFO_TABLE_STYLE = TableStyle([
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica-Bold'),
+])
+
+_LINE_ITEMS_TABLE_STYLE = TableStyle([
+    # Header
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4F46E5')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    
+    # Body
+    ('ALIGN', (2, 1), (2, -1), 'CENTER'),
+    ('ALIGN', (3, 1), (-1, -1), 'RIGHT'),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+])
+
+_TOTALS_TABLE_STYLE = TableStyle([
+    ('ALIGN', (3, 0), (-1, -1), 'RIGHT'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('FONTNAME', (4, 0), (-1, -1), 'Helvetica-Bold'),
+    ('LINEABOVE', (4, 0), (-1, 0), 1, colors.black),
+    ('LINEABOVE', (4, -1), (-1, -1), 2, colors.black),
+])
+
+# Bound str.format methods, looked up once instead of parsing an f-string per cell
+_MONEY_FMT = "₹{:,.2f}".format
+_PCT_FMT = "{}%".format
+
+_LINE_ITEMS_COL_WIDTHS = [0.5*inch, 2.5*inch, 0.7*inch, 1*inch, 1*inch, 1.3*inch]
+
+_RECEIPT_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('PADDING', (0, 0), (-1, -1), 10),
+])
 
 
 def generate_invoice_pdf(invoice_data: dict, company_data: dict) -> bytes:
@@ -20,152 +101,176 @@ def generate_invoice_pdf(invoice_data: dict, company_data: dict) -> bytes:
         bytes: PDF content
     """
     buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=30, leftMargin=30,
-                           topMargin=30, bottomMargin=18)
+    write_invoice_pdf(invoice_data, company_data, buffer)
+    return buffer.getvalue()
+
+
+def invoice_pdf_cache_key(invoice_data: dict, company_data: dict) -> bytes:
+    """Canonical payload an unchanged invoice always serializes to"""
+    return orjson.dumps((invoice_data, company_data), option=orjson.OPT_SORT_KEYS)
+
+
+def get_cached_invoice_pdf(key: bytes) -> Optional[bytes]:
+    """Previously rendered PDF for this payload, if still cached"""
+    with _PDF_CACHE_LOCK:
+        pdf = _PDF_CACHE.get(key)
+        if pdf is not None:
+            _PDF_CACHE.move_to_end(key)
+        return pdf
+
+
+def cache_invoice_pdf(key: bytes, pdf: bytes) -> None:
+    """
+    Remember a rendered PDF
+    
+    PDFs above INVOICE_PDF_CACHE_ITEM_MAX_BYTES are skipped; otherwise the
+    least recently used entries are evicted until the cache fits in
+    INVOICE_PDF_CACHE_MAX_BYTES.
+    """
+    global _PDF_CACHE_SIZE
+    
+    size = len(key) + len(pdf)
+    if len(pdf) > settings.INVOICE_PDF_CACHE_ITEM_MAX_BYTES or size > settings.INVOICE_PDF_CACHE_MAX_BYTES:
+        return
+    
+    with _PDF_CACHE_LOCK:
+        old = _PDF_CACHE.pop(key, None)
+        if old is not None:
+            _PDF_CACHE_SIZE -= len(key) + len(old)
+        while _PDF_CACHE and _PDF_CACHE_SIZE + size > settings.INVOICE_PDF_CACHE_MAX_BYTES:
+            old_key, old_pdf = _PDF_CACHE.popitem(last=False)
+            _PDF_CACHE_SIZE -= len(old_key) + len(old_pdf)
+        _PDF_CACHE[key] = pdf
+        _PDF_CACHE_SIZE += size
+
+
+def generate_invoice_pdf_cached(invoice_data: dict, company_data: dict) -> bytes:
+    """
+    Generate invoice PDF, reusing the bytes of an identical earlier render
+    
+    Email resends of an unchanged invoice serialize to the same canonical
+    payload and skip the ReportLab build entirely.
+    """
+    key = invoice_pdf_cache_key(invoice_data, company_data)
+    pdf = get_cached_invoice_pdf(key)
+    if pdf is None:
+        pdf = generate_invoice_pdf(invoice_data, company_data)
+        cache_invoice_pdf(key, pdf)
+    return pdf
+
+
+def write_invoice_pdf(invoice_data: dict, company_data: dict, output: BinaryIO) -> None:
+    """
+    Render invoice PDF straight into a writable binary file object
+    
+    Args:
+        invoice_data: Invoice details with line items
+        company_data: Company/tenant details
+        output: File-like object the PDF is written to
+    """
+    # invariant: no creation timestamp/random ID, so equal input gives equal bytes
+    doc = SimpleDocTemplate(output, pagesize=A4, rightMargin=30, leftMargin=30,
+                           topMargin=30, bottomMargin=18, invariant=True)
     
     # Container for the 'Flowable' objects
     elements = []
     
-    # Define styles
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=colors.HexColor('#4F46E5'),
-        spaceAfter=30,
-        alignment=TA_CENTER
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=colors.HexColor('#1F2937'),
-        spaceAfter=12
-    )
-    
-    normal_style = styles['Normal']
-    
     # Title
-    title = Paragraph("INVOICE", title_style)
+    title = Paragraph("INVOICE", _TITLE_STYLE)
     elements.append(title)
     elements.append(Spacer(1, 12))
     
     # Company and Invoice Info
+    # Plain strings are drawn directly; only the address needs Paragraph wrapping.
+    # Bold for the company name and the label column comes from _INFO_TABLE_STYLE
     info_data = [
-        [Paragraph(f"<b>{company_data.get('name', 'Company Name')}</b>", normal_style),
-         Paragraph(f"<b>Invoice #:</b> {invoice_data.get('invoiceNumber', 'N/A')}", normal_style)],
-        [Paragraph(company_data.get('address', 'Company Address'), normal_style),
-         Paragraph(f"<b>Date:</b> {invoice_data.get('invoiceDate', 'N/A')}", normal_style)],
-        [Paragraph(f"<b>GST:</b> {company_data.get('taxId', 'N/A')}", normal_style),
-         Paragraph(f"<b>Due Date:</b> {invoice_data.get('dueDate', 'N/A')}", normal_style)],
+        [company_data.get('name', 'Company Name'),
+         'Invoice #:', invoice_data.get('invoiceNumber', 'N/A')],
+        [Paragraph(company_data.get('address', 'Company Address'), _NORMAL_STYLE),
+         'Date:', invoice_data.get('invoiceDate', 'N/A')],
+        [f"GST: {company_data.get('taxId', 'N/A')}",
+         'Due Date:', invoice_data.get('dueDate', 'N/A')],
     ]
     
-    info_table = Table(info_data, colWidths=[3*inch, 3*inch])
-    info_table.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-    ]))
+    info_table = Table(info_data, colWidths=[3*inch, 1.6*inch, 1.4*inch])
+    info_table.setStyle(_INFO_TABLE_STYLE)
     elements.append(info_table)
     elements.append(Spacer(1, 20))
     
     # Bill To
-    elements.append(Paragraph("<b>Bill To:</b>", heading_style))
+    elements.append(Paragraph("<b>Bill To:</b>", _HEADING_STYLE))
     customer_info = Paragraph(f"""
         <b>{invoice_data.get('customerName', 'Customer Name')}</b><br/>
         {invoice_data.get('customerEmail', '')}<br/>
         {invoice_data.get('customerPhone', '')}
-    """, normal_style)
+    """, _NORMAL_STYLE)
     elements.append(customer_info)
     elements.append(Spacer(1, 20))
     
     # Line Items Table
-    line_items_data = [
-        ['#', 'Description', 'Qty', 'Rate', 'Tax %', 'Amount']
-    ]
-    
-    for idx, item in enumerate(invoice_data.get('lineItems', []), 1):
-        line_items_data.append([
+    line_items_data = [['#', 'Description', 'Qty', 'Rate', 'Tax %', 'Amount']]
+    line_items_data.extend([
+        [
             str(idx),
             item.get('description', ''),
             str(item.get('quantity', 0)),
-            f"₹{item.get('rate', 0):,.2f}",
-            f"{item.get('taxRate', 0)}%",
-            f"₹{item.get('totalAmount', 0):,.2f}"
-        ])
-    
-    # Add totals
-    line_items_data.append(['', '', '', '', 'Subtotal:', f"₹{invoice_data.get('subtotal', 0):,.2f}"])
-    line_items_data.append(['', '', '', '', 'Tax:', f"₹{invoice_data.get('taxAmount', 0):,.2f}"])
-    line_items_data.append(['', '', '', '', 'Discount:', f"₹{invoice_data.get('discountAmount', 0):,.2f}"])
-    line_items_data.append(['', '', '', '', '<b>Total:</b>', f"<b>₹{invoice_data.get('total', 0):,.2f}</b>"])
-    
-    line_items_table = Table(line_items_data, colWidths=[0.5*inch, 2.5*inch, 0.7*inch, 1*inch, 1*inch, 1.3*inch])
-    line_items_table.setStyle(TableStyle([
-        # Header
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4F46E5')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        
-        # Body
-        ('ALIGN', (2, 1), (2, -5), 'CENTER'),
-        ('ALIGN', (3, 1), (-1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 1), (-1, -5), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 9),
-        ('GRID', (0, 0), (-1, -5), 0.5, colors.grey),
-        
-        # Totals section
-        ('FONTNAME', (4, -4), (-1, -1), 'Helvetica-Bold'),
-        ('LINEABOVE', (4, -4), (-1, -4), 1, colors.black),
-        ('LINEABOVE', (4, -1), (-1, -1), 2, colors.black),
-    ]))
+            _MONEY_FMT(item.get('rate', 0)),
+            _PCT_FMT(item.get('taxRate', 0)),
+            _MONEY_FMT(item.get('totalAmount', 0))
+        ]
+        for idx, item in enumerate(invoice_data.get('lineItems', ()), 1)
+    ])
     
+    # LongTable lays rows out page by page instead of measuring the whole table up front;
+    # header repeats on every page
+    line_items_table = LongTable(line_items_data, colWidths=_LINE_ITEMS_COL_WIDTHS,
+                                 repeatRows=1, splitByRow=1)
+    line_items_table.setStyle(_LINE_ITEMS_TABLE_STYLE)
     elements.append(line_items_table)
+    
+    # Totals are a separate small table kept on one page
+    totals_data = [
+        ['', '', '', '', 'Subtotal:', _MONEY_FMT(invoice_data.get('subtotal', 0))],
+        ['', '', '', '', 'Tax:', _MONEY_FMT(invoice_data.get('taxAmount', 0))],
+        ['', '', '', '', 'Discount:', _MONEY_FMT(invoice_data.get('discountAmount', 0))],
+        ['', '', '', '', '<b>Total:</b>', f"<b>{_MONEY_FMT(invoice_data.get('total', 0))}</b>"],
+    ]
+    totals_table = Table(totals_data, colWidths=_LINE_ITEMS_COL_WIDTHS)
+    totals_table.setStyle(_TOTALS_TABLE_STYLE)
+    elements.append(KeepTogether(totals_table))
+    
     elements.append(Spacer(1, 30))
     
     # Notes
     if invoice_data.get('notes'):
-        elements.append(Paragraph("<b>Notes:</b>", heading_style))
-        elements.append(Paragraph(invoice_data.get('notes', ''), normal_style))
+        elements.append(Paragraph("<b>Notes:</b>", _HEADING_STYLE))
+        elements.append(Paragraph(invoice_data.get('notes', ''), _NORMAL_STYLE))
         elements.append(Spacer(1, 20))
     
     # Terms
     if invoice_data.get('terms'):
-        elements.append(Paragraph("<b>Terms & Conditions:</b>", heading_style))
-        elements.append(Paragraph(invoice_data.get('terms', ''), normal_style))
-    
-    # Footer
-    elements.append(Spacer(1, 30))
-    footer = Paragraph(
-        f"<i>Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</i>",
-        ParagraphStyle('Footer', parent=normal_style, fontSize=8, textColor=colors.grey, alignment=TA_CENTER)
-    )
-    elements.append(footer)
+        elements.append(Paragraph("<b>Terms & Conditions:</b>", _HEADING_STYLE))
+        elements.append(Paragraph(invoice_data.get('terms', ''), _NORMAL_STYLE))
     
     # Build PDF
     doc.build(elements)
-    
-    # Get PDF content
-    pdf_content = buffer.getvalue()
-    buffer.close()
-    
-    return pdf_content
 
 
 def generate_receipt_pdf(receipt_data: dict, company_data: dict) -> bytes:
     """Generate PDF for payment receipt"""
     buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=A4)
+    write_receipt_pdf(receipt_data, company_data, buffer)
+    return buffer.getvalue()
+
+
+def write_receipt_pdf(receipt_data: dict, company_data: dict, output: BinaryIO) -> None:
+    """Render payment receipt PDF into a writable binary file object"""
+    doc = SimpleDocTemplate(output, pagesize=A4)
     
     elements = []
-    styles = getSampleStyleSheet()
     
     # Title
-    title = Paragraph("PAYMENT RECEIPT", styles['Title'])
+    title = Paragraph("PAYMENT RECEIPT", _STYLES['Title'])
     elements.append(title)
     elements.append(Spacer(1, 20))
     
@@ -174,22 +279,13 @@ def generate_receipt_pdf(receipt_data: dict, company_data: dict) -> bytes:
         ['Receipt Number:', receipt_data.get('receiptNumber', 'N/A')],
         ['Date:', receipt_data.get('receiptDate', 'N/A')],
         ['Customer:', receipt_data.get('customerName', 'N/A')],
-        ['Amount Received:', f"₹{receipt_data.get('amount', 0):,.2f}"],
+        ['Amount Received:', _MONEY_FMT(receipt_data.get('amount', 0))],
         ['Payment Method:', receipt_data.get('paymentMethod', 'N/A')],
     ]
     
     table = Table(data, colWidths=[2*inch, 4*inch])
-    table.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-        ('PADDING', (0, 0), (-1, -1), 10),
-    ]))
+    table.setStyle(_RECEIPT_TABLE_STYLE)
     
     elements.append(table)
     
     doc.build(elements)
-    
-    pdf_content = buffer.getvalue()
-    buffer.close()
-    
-    return pdf_content
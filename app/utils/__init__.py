@@ -2,5 +2,6 @@
 Utility functions
 """
 from app.utils.date import calculate_trial_end_date, is_trial_expired
+from app.utils.ids import uuid7
 
-__all__ = ["calculate_trial_end_date", "is_trial_expired"]
\ No newline at end of file
+__all__ = ["calculate_trial_end_date", "is_trial_expired", "uuid7"]
\ No newline at end of file
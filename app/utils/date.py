@@ -1,7 +1,8 @@
 """
 Date utility functions
 """
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
 
 
 def calculate_trial_end_date(start_date: datetime, days: int = 14) -> datetime:
@@ -23,9 +24,11 @@ def is_trial_expired(trial_end_date: datetime) -> bool:
     Check if trial period has expired
     
     Args:
-        trial_end_date: The trial end date to check
+        trial_end_date: The trial end date to check (naive values are UTC)
         
     Returns:
         bool: True if trial has expired, False otherwise
     """
-    return datetime.utcnow() > trial_end_date
\ No newline at end of file
+    if trial_end_date.tzinfo is None:
+        trial_end_date = trial_end_date.replace(tzinfo=timezone.utc)
+    return time.time() > trial_end_date.timestamp()
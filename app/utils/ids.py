@@ -0,0 +1,28 @@
+"""
+Identifier utility functions
+"""
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562)
+
+    The first 48 bits are the Unix timestamp in milliseconds, so ids created
+    later sort later and new rows land on the right-most B-tree leaf instead
+    of random pages. The remaining 74 bits are random.
+
+    Returns:
+        uuid.UUID: A new version 7 UUID
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76  # version
+    value |= ((rand >> 68) & 0xFFF) << 64  # rand_a
+    value |= 0b10 << 62  # variant
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF  # rand_b
+    return uuid.UUID(int=value)
@@ -1,14 +1,29 @@
 """
 Check existing admin users
 """
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from dotenv import load_dotenv
-import os
 
 load_dotenv()
 
-DATABASE_URL = os.getenv("DATABASE_URL")
-engine = create_engine(DATABASE_URL)
+from app.core.script_db import get_engine
+
+engine = get_engine()
+
+_Q_ADMINS = text("""
+    SELECT 
+        email,
+        first_name,
+        last_name,
+        role,
+        email_verified,
+        is_active,
+        created_at
+    FROM users 
+    WHERE role = 'admin'
+    ORDER BY created_at ASC
+""")
+_Q_USER_COUNT = text("SELECT COUNT(*) FROM users")
 
 print("=" * 60)
 print("CHECKING ADMIN USERS")
@@ -17,21 +32,7 @@ print("=" * 60)
 try:
     with engine.connect() as conn:
         # Check all admin users
-        query = text("""
-            SELECT 
-                email,
-                first_name,
-                last_name,
-                role,
-                email_verified,
-                is_active,
-                created_at
-            FROM users 
-            WHERE role = 'admin'
-            ORDER BY created_at ASC
-        """)
-        
-        result = conn.execute(query)
+        result = conn.execute(_Q_ADMINS)
         admins = result.fetchall()
         
         if admins:
@@ -52,8 +53,7 @@ try:
             print("First user automatically gets admin role")
         
         # Check total users
-        count_query = text("SELECT COUNT(*) FROM users")
-        total = conn.execute(count_query).scalar()
+        total = conn.execute(_Q_USER_COUNT).scalar()
         print(f"Total users in database: {total}")
         
 except Exception as e:
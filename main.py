@@ -3,9 +3,10 @@ RMS Billing API - Main Application
 Multi-tenant SaaS billing system
 """
 import os
+import time
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 import logging
 
 from app.core.config import settings
@@ -14,11 +15,15 @@ from app.api.v1.router import api_router
 # Configure logging
 logging.basicConfig(
     level=logging.INFO if not settings.DEBUG else logging.DEBUG,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    force=True
 )
 
 logger = logging.getLogger(__name__)
 
+# Last /health database probe, reused for HEALTH_CHECK_TTL seconds
+_LAST_HEALTH = {"ts": float("-inf"), "db_status": "error"}
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.APP_NAME,
@@ -26,7 +31,8 @@ app = FastAPI(
     description="Multi-tenant SaaS billing and invoicing system",
     docs_url="/docs",
     redoc_url="/redoc",
-    openapi_url="/openapi.json"
+    openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -45,39 +51,34 @@ app.include_router(api_router, prefix=settings.API_V1_PREFIX)
 @app.on_event("startup")
 async def startup_event():
     """Run on application startup - with graceful error handling"""
-    logger.info("=" * 60)
-    logger.info("≡ƒÜÇ Starting RMS Billing API")
-    logger.info("=" * 60)
-    logger.info(f"≡ƒôª Version: {settings.VERSION}")
-    logger.info(f"≡ƒöº Environment: {'Development' if settings.DEBUG else 'Production'}")
+    logger.info(
+        "Starting RMS Billing API v%s (%s)",
+        settings.VERSION, "Development" if settings.DEBUG else "Production"
+    )
 
     # Import here to avoid blocking app startup
     try:
         from app.core.database import init_db, test_connection
 
-        logger.info("≡ƒöì Testing database connection...")
         if test_connection():
-            logger.info("Γ£à Database connection successful")
-            logger.warning("ΓÜá∩╕Å App will continue but database operations may fail")
+            logger.info("Database connection successful")
         else:
-            logger.error("Γ¥î Database connection failed")
-            logger.warning("=" * 60)
-            logger.warning("ΓÜá∩╕Å APP STARTED IN DEGRADED MODE")
-            logger.warning("ΓÜá∩╕Å Database is not accessible")
-            logger.warning("≡ƒÆí Solutions:")
-            logger.warning("   1. Check Render database status")
-            logger.warning("   2. Use local PostgreSQL instead")
-            logger.warning("   3. Check DATABASE_URL in .env")
-            logger.warning("=" * 60)
+            logger.error("Database connection failed - app started in degraded mode")
+            logger.warning("Check the Render database status and DATABASE_URL in .env")
+
+    except Exception as e:
+        logger.error("Startup error: %s", e)
+        logger.warning("App will continue but some features may not work")
 
+    # FastAPI caches the result in app.openapi_schema, so the first /docs or
+    # /openapi.json request after a deploy is served from it
+    try:
+        app.openapi()
     except Exception as e:
-        logger.error(f"Γ¥î Startup error: {str(e)}")
-        logger.warning("ΓÜá∩╕Å App will continue but some features may not work")
+        logger.error("OpenAPI schema generation failed: %s", e)
 
-    logger.info("=" * 60)
-    logger.info("Γ£à Application ready!")
-    logger.info(f"≡ƒô¥ API Docs: http://localhost:8000/docs")
-    logger.info("=" * 60)
+    logger.info("Application ready")
+    logger.debug("API Docs: http://localhost:8000/docs")
 
 
 @app.get("/")
@@ -94,11 +95,15 @@ async def root():
 @app.get("/health")
 async def health_check():
     """Health check endpoint with database status"""
-    try:
-        from app.core.database import test_connection
-        db_status = "connected" if test_connection() else "disconnected"
-    except Exception:
-        db_status = "error"
+    now = time.monotonic()
+    if now - _LAST_HEALTH["ts"] >= settings.HEALTH_CHECK_TTL:
+        try:
+            from app.core.database import test_connection
+            _LAST_HEALTH["db_status"] = "connected" if test_connection() else "disconnected"
+        except Exception:
+            _LAST_HEALTH["db_status"] = "error"
+        _LAST_HEALTH["ts"] = now
+    db_status = _LAST_HEALTH["db_status"]
 
     return {
         "status": "healthy" if db_status == "connected" else "degraded",
@@ -111,8 +116,8 @@ async def health_check():
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler"""
-    logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
-    return JSONResponse(
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": {
@@ -0,0 +1,18 @@
+"""
+Refresh the dashboard materialized views
+Run nightly (render.yaml cron job): python refresh_dashboard_views.py
+"""
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.core.database import SessionLocal
+from app.crud.dashboard import DashboardCRUD
+
+if __name__ == "__main__":
+    db = SessionLocal()
+    try:
+        DashboardCRUD.refresh_monthly_revenue(db)
+        print("mv_monthly_revenue refreshed")
+    finally:
+        db.close()
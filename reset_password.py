@@ -1,15 +1,22 @@
 """
 Simple password reset using bcrypt directly
 """
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from dotenv import load_dotenv
 import os
 import bcrypt
 
 load_dotenv()
 
-DATABASE_URL = os.getenv("DATABASE_URL")
-engine = create_engine(DATABASE_URL)
+from app.core.script_db import get_engine
+
+engine = get_engine()
+
+_Q_UPDATE_PASSWORD = text("""
+    UPDATE users 
+    SET password_hash = :password_hash
+    WHERE email = :email
+""")
 
 # Email to reset
 email = "junaid.abdur@example.com"
@@ -17,7 +24,7 @@ new_password = "SecurePass123!"
 
 # Hash the new password using bcrypt directly
 password_bytes = new_password.encode('utf-8')
-salt = bcrypt.gensalt()
+salt = bcrypt.gensalt(rounds=int(os.getenv("BCRYPT_ROUNDS", "12")))
 password_hash = bcrypt.hashpw(password_bytes, salt).decode('utf-8')
 
 print("=" * 60)
@@ -27,13 +34,7 @@ print("=" * 60)
 try:
     with engine.connect() as conn:
         # Update password
-        query = text("""
-            UPDATE users 
-            SET password_hash = :password_hash
-            WHERE email = :email
-        """)
-        
-        result = conn.execute(query, {"password_hash": password_hash, "email": email})
+        result = conn.execute(_Q_UPDATE_PASSWORD, {"password_hash": password_hash, "email": email})
         conn.commit()
         
         if result.rowcount > 0:
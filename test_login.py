@@ -5,14 +5,16 @@ import sys
 sys.path.insert(0, 'c:/Users/Dell/Desktop/invoice_app_backend-main/invoice_app_backend')
 
 from app.core.security import verify_password
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from dotenv import load_dotenv
-import os
 
 load_dotenv()
 
-DATABASE_URL = os.getenv("DATABASE_URL")
-engine = create_engine(DATABASE_URL)
+from app.core.script_db import get_engine
+
+engine = get_engine()
+
+_Q_PASSWORD_HASH = text("SELECT password_hash FROM users WHERE email = :email")
 
 email = "junaid.abdur@example.com"
 test_password = "SecurePass123!"
@@ -24,8 +26,7 @@ print("=" * 60)
 try:
     with engine.connect() as conn:
         # Get stored hash
-        query = text("SELECT password_hash FROM users WHERE email = :email")
-        result = conn.execute(query, {"email": email}).fetchone()
+        result = conn.execute(_Q_PASSWORD_HASH, {"email": email}).fetchone()
         
         if result:
             stored_hash = result[0]
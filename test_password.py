@@ -1,15 +1,17 @@
 """
 Test password verification
 """
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from dotenv import load_dotenv
-import os
 import bcrypt
 
 load_dotenv()
 
-DATABASE_URL = os.getenv("DATABASE_URL")
-engine = create_engine(DATABASE_URL)
+from app.core.script_db import get_engine
+
+engine = get_engine()
+
+_Q_PASSWORD_HASH = text("SELECT password_hash FROM users WHERE email = :email")
 
 email = "junaid.abdur@example.com"
 test_password = "SecurePass123!"
@@ -21,8 +23,7 @@ print("=" * 60)
 try:
     with engine.connect() as conn:
         # Get stored hash
-        query = text("SELECT password_hash FROM users WHERE email = :email")
-        result = conn.execute(query, {"email": email}).fetchone()
+        result = conn.execute(_Q_PASSWORD_HASH, {"email": email}).fetchone()
         
         if result:
             stored_hash = result[0]
@@ -36,11 +37,8 @@ try:
             is_valid = bcrypt.checkpw(password_bytes, stored_hash_bytes)
             print(f"\nBcrypt verification: {is_valid}")
             
-            # Test with truncated password (like security.py does)
-            password_truncated_bytes = password_bytes[:72]
-            password_truncated = password_truncated_bytes.decode('utf-8', errors='ignore')
-            
-            is_valid_truncated = bcrypt.checkpw(password_truncated.encode('utf-8'), stored_hash_bytes)
+            # Test with truncated password (bcrypt only reads the first 72 bytes)
+            is_valid_truncated = bcrypt.checkpw(password_bytes[:72], stored_hash_bytes)
             print(f"Bcrypt verification (truncated): {is_valid_truncated}")
             
         else:
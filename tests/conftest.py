@@ -0,0 +1,106 @@
+"""
+Shared test fixtures
+Ella test modules-um share cheyyunna fixtures
+"""
+import httpx
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# ✅ FIX: Import FastAPI app instance
+from invoice_app_backend.main import app
+from app.core.database import engine, get_db
+
+# Mock authentication
+# Production-il proper JWT token generate cheyyum
+MOCK_AUTH_HEADERS = {"Authorization": "Bearer mock_token"}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _orjson_response_json():
+    """
+    response.json() orjson vechu decode cheyyunnu (stdlib json-inekkal fast)
+    TestClient-um AsyncClient-um httpx.Response thanne return cheyyunnathu kondu randum cover aavum
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(httpx.Response, "json", lambda self, **kwargs: orjson.loads(self.content))
+        yield
+
+
+@pytest.fixture(scope="session")
+def test_client():
+    """
+    Test client fixture
+    Session-il orikkal mathram create cheyyunnu; startup/shutdown events orikkal run aavum
+    """
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def auth_headers(test_client):
+    """
+    Authentication headers fixture
+    Real implementation-il login cheythu token edukkum - session-il orikkal mathram
+    """
+    return MOCK_AUTH_HEADERS
+
+
+@pytest.fixture(scope="module")
+def db_connection():
+    """
+    Module-wide connection with one outer transaction
+    Module-ile ella tests-um kazhinjal full rollback; seed data orikkal mathram insert cheythal mathi
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    yield connection
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def db_session(db_connection):
+    """
+    Per-test session on a SAVEPOINT inside the module transaction
+    App-inte get_db-um ee session thanne use cheyyum, so test data API-kku kaanam
+    """
+    session = Session(bind=db_connection, join_transaction_mode="create_savepoint")
+    app.dependency_overrides[get_db] = lambda: session
+    yield session
+    app.dependency_overrides.pop(get_db, None)
+    session.close()
+
+
+@pytest.fixture(scope="module")
+def cached_get(test_client, auth_headers):
+    """
+    Read-only GET responses module-il URL vechu cache cheyyunnu
+    Status code check cheyyunna (unauthorized / invalid) tests-il use cheyyaruthu
+    """
+    cache = {}
+
+    def _get(url):
+        if url not in cache:
+            cache[url] = test_client.get(url, headers=auth_headers)
+        return cache[url]
+
+    return _get
+
+
+@pytest.fixture
+def query_counter():
+    """
+    Test-il app engine execute cheytha SQL statements record cheyyunnu
+    len(query_counter) vechu N+1 regressions pidikkam
+    """
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", _record)